@@ -0,0 +1,93 @@
+"""On-disk cache for transcripts and LLM completions.
+
+Transcription and summarization are the slow steps. When the same audio
+or prompt is processed again — e.g. while iterating on a template — the
+cached result is reused instead of re-running whisper, pyannote, or the
+LLM.
+
+Entries live under $MN_CACHE_DIR (default: ~/.cache/make-notes), one
+file per entry, grouped by kind:
+
+    transcripts/<key>
+    completions/<key>
+
+Keys are BLAKE2b digests of everything that affects the result, so a
+change to the audio, prompt, or model settings is simply a miss.
+
+The cache holds clinical data. It is opt-in (--cache), and directories
+and files are created owner-only (0700 / 0600). With --cache-ttl, entries
+older than the limit are treated as misses and deleted when next looked up.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from . import log as _log
+
+_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def cache_dir():
+    """Return the cache root, evaluated at call time."""
+    root = os.environ.get("MN_CACHE_DIR")
+    if root:
+        return Path(root)
+    xdg = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(xdg) / "make-notes"
+
+
+def hash_file(path):
+    """BLAKE2b hex digest of a file's contents, read in 1 MiB chunks."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def make_key(*parts):
+    """BLAKE2b hex digest over the str() of each part."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        h.update(str(part).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def get(kind, key, max_age=None):
+    """Return the cached text for (kind, key), or None on a miss.
+
+    With max_age (seconds), an older entry is a miss and is deleted.
+    """
+    path = cache_dir() / kind / key
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            path.unlink()
+            return None
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeError):
+        return None
+
+
+def put(kind, key, text):
+    """Store text under (kind, key). Never raises — a failed write is a warning."""
+    root = cache_dir()
+    tmp = None
+    try:
+        root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        (root / kind).mkdir(mode=0o700, exist_ok=True)
+        # mkstemp creates the file 0600; rename makes the write atomic.
+        fd, tmp = tempfile.mkstemp(dir=root / kind, prefix=".tmp-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, root / kind / key)
+    except (OSError, UnicodeError) as e:
+        _log.warn(f"Warning: could not write cache entry: {e}")
+        if tmp is not None:
+            # Don't leave a partial copy of clinical text behind.
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
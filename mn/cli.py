@@ -13,24 +13,28 @@ Nine tools, each useful alone, composable together:
     mn session.wav --template templates/soap.txt
 
 Stdin/stdout everywhere. JSON lines as the interchange format.
+
+Each entry point takes an optional argv list (default: sys.argv[1:]), so
+the tools can also be driven from Python.
 """
 
 import argparse
+import contextlib
+import functools
+import itertools
 import os
+import stat
 import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
-import httpx
-
-from . import edit as _edit
+# httpx, summarize, record, redact and edit are imported inside the
+# commands that use them, so `--help` and the stdin filters start fast.
+from . import cache as _cache
 from . import fmt as _fmt
 from . import log as _log
-from . import record as _record
-from . import redact as _redact
-from . import summarize as _summarize
 from . import transcribe as _transcribe
 from .config import apply_config, load_config
-from .summarize import RemoteEndpointError
 
 
 # -- Error handling ---------------------------------------------------------
@@ -43,13 +47,16 @@ def _die(msg):
 
 
 def _check_audio_file(path):
-    """Validate that an audio file exists and is readable."""
-    p = Path(path)
-    if not p.exists():
+    """Validate that an audio file exists and is readable (one stat call)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         _die(f"Audio file not found: {path}")
-    if not p.is_file():
+    except OSError as e:
+        _die(f"Cannot access audio file {path}: {e.strerror}")
+    if not stat.S_ISREG(st.st_mode):
         _die(f"Not a file: {path}")
-    if p.stat().st_size == 0:
+    if st.st_size == 0:
         _die(f"Audio file is empty: {path}")
 
 
@@ -105,8 +112,13 @@ def _add_whisper_args(p):
                    help="whisper model size (default: base)")
     p.add_argument("--device", default="cpu",
                    help="compute device (default: cpu)")
-    p.add_argument("--compute-type", default="int8",
-                   help="quantization type (default: int8)")
+    p.add_argument("--compute-type", default=None,
+                   help="quantization: int8, int8_float16, int8_bfloat16, "
+                        "float16, bfloat16, float32 "
+                        "(default: int8 on CPU, int8_float16 on CUDA)")
+    p.add_argument("--batch-size", type=int, default=None,
+                   help="decode this many audio chunks per whisper pass "
+                        "(GPU speedup; default: sequential)")
 
 
 def _add_diarization_args(p):
@@ -135,27 +147,108 @@ def _add_llm_args(p):
                    help="session date for template $date placeholder (YYYY-MM-DD)")
 
 
+# Parent parsers for the flag groups shared by several commands. Built on
+# first use and cached, so repeated in-process invocations reuse them.
+
+
+@functools.lru_cache(maxsize=None)
+def _whisper_parent():
+    p = argparse.ArgumentParser(add_help=False)
+    _add_whisper_args(p)
+    return p
+
+
+@functools.lru_cache(maxsize=None)
+def _diarization_parent():
+    p = argparse.ArgumentParser(add_help=False)
+    _add_diarization_args(p)
+    return p
+
+
+@functools.lru_cache(maxsize=None)
+def _llm_parent():
+    p = argparse.ArgumentParser(add_help=False)
+    _add_llm_args(p)
+    return p
+
+
+def _add_stream_flag(p):
+    p.add_argument("--stream", action="store_true",
+                   help="print the summary as it is generated")
+
+
+def _add_cache_flag(p):
+    p.add_argument("--cache", action="store_true",
+                   help="reuse cached transcripts and summaries "
+                        "(stored owner-only under $MN_CACHE_DIR)")
+    p.add_argument("--cache-ttl", type=float, default=None, metavar="DAYS",
+                   help="with --cache, ignore and delete entries older "
+                        "than DAYS (default: keep forever)")
+
+
+def _check_cache_args(args):
+    """Validate --cache-ttl up front, before any models load."""
+    if args.cache_ttl is None:
+        return
+    if not args.cache:
+        _die("--cache-ttl requires --cache")
+    if args.cache_ttl < 0:
+        _die("--cache-ttl must not be negative")
+
+
+def _cache_ttl(args):
+    """--cache-ttl in seconds, or None. See _check_cache_args()."""
+    days = getattr(args, "cache_ttl", None)
+    return None if days is None else days * 86400
+
+
+def _transcript_cache_key(args):
+    """Cache key for a transcript: audio contents + model/diarization settings."""
+    try:
+        audio_hash = _cache.hash_file(args.audio)
+    except OSError:
+        return None
+    return _cache.make_key(
+        audio_hash, args.model, args.device,
+        args.compute_type or _transcribe.default_compute_type(args.device),
+        args.batch_size, args.num_speakers, args.min_speakers, args.max_speakers,
+    )
+
+
 def _transcribe_audio(args, _whisper=None, _diarizer=None, quiet=False):
     """Shared transcription logic for transcribe and main commands.
 
     Pass _whisper/_diarizer to reuse pre-loaded models (batch mode).
+    With --cache, a previous transcript of the same audio is reused.
     """
     if not quiet:
         _progress("Transcribing...")
-    try:
-        segments = _transcribe.transcribe_and_diarize(
-            args.audio,
-            model_size=args.model,
-            device=args.device,
-            compute_type=args.compute_type,
-            num_speakers=args.num_speakers,
-            min_speakers=args.min_speakers,
-            max_speakers=args.max_speakers,
-            _whisper=_whisper,
-            _diarizer=_diarizer,
-        )
-    except (OSError, RuntimeError, ValueError) as e:
-        _die(f"Transcription failed: {e}")
+
+    key = _transcript_cache_key(args) if getattr(args, "cache", False) else None
+    cached = (_cache.get("transcripts", key, max_age=_cache_ttl(args))
+              if key else None)
+    if cached is not None:
+        segments = _transcribe.from_jsonl(cached)
+        if not quiet:
+            _progress("  using cached transcript")
+    else:
+        try:
+            segments = _transcribe.transcribe_and_diarize(
+                args.audio,
+                model_size=args.model,
+                device=args.device,
+                compute_type=args.compute_type,
+                num_speakers=args.num_speakers,
+                min_speakers=args.min_speakers,
+                max_speakers=args.max_speakers,
+                batch_size=args.batch_size,
+                _whisper=_whisper,
+                _diarizer=_diarizer,
+            )
+        except (OSError, RuntimeError, ValueError) as e:
+            _die(f"Transcription failed: {e}")
+        if key:
+            _cache.put("transcripts", key, _transcribe.to_jsonl(segments))
 
     if args.speakers:
         segments = _transcribe.label_speakers(segments, args.speakers)
@@ -168,27 +261,108 @@ def _transcribe_audio(args, _whisper=None, _diarizer=None, quiet=False):
 
 
 def _read_stdin_segments():
-    """Read JSONL segments from stdin, return None if empty."""
-    text = sys.stdin.read()
-    if not text.strip():
+    """Stream JSONL segments from stdin, return None if empty.
+
+    Returns an iterator: single-pass consumers (fmt, redact, edit) start
+    work as lines arrive. Callers that need several passes wrap it in list().
+
+    Exits with an error if stdin is a terminal, rather than waiting on
+    input that is not coming.
+    """
+    if sys.stdin.isatty():
+        _die("No input on stdin. Pipe in JSON lines, "
+             "e.g. mn-transcribe session.wav | mn-fmt")
+    # Parse bytes: JSONL is UTF-8 whatever the locale says, the same
+    # encoding _emit_lines() writes, and orjson and json accept bytes.
+    stream = getattr(sys.stdin, "buffer", sys.stdin)
+    segments = _transcribe.iter_jsonl(stream)
+    first = next(segments, None)
+    if first is None:
+        return None
+    return itertools.chain([first], segments)
+
+
+def _emit_lines(lines):
+    """Write JSON lines to stdout one at a time, each followed by a newline.
+
+    stdout is block-buffered when piped, so output streams out in
+    buffer-sized writes without first being joined into one string.
+
+    Lines go out as UTF-8 bytes whatever the locale encoding, matching
+    _read_stdin_segments(); streams without a buffer get text.
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.writelines(f"{line}\n" for line in lines)
+        return
+    sys.stdout.flush()  # anything already written as text goes first
+    out.writelines(f"{line}\n".encode() for line in lines)
+    out.flush()
+
+
+def _emit_blocks(blocks):
+    """Write blocks to stdout separated by blank lines, then a newline.
+
+    Same output as print("\n\n".join(blocks)), without the joined string.
+    """
+    sep = ""
+    for block in blocks:
+        sys.stdout.write(sep)
+        sys.stdout.write(block)
+        sep = "\n\n"
+    sys.stdout.write("\n")
+
+
+@functools.lru_cache(maxsize=64)
+def _split_names(value):
+    """Parse a comma-separated name list ("A, B") → ("A", "B"), or None.
+
+    Memoized: the same flag and config strings recur across calls.
+    """
+    if not value:
         return None
-    return _transcribe.from_jsonl(text)
+    return tuple(n.strip() for n in value.split(","))
 
 
-def _apply_redaction(segments, args):
-    """Apply PII redaction if --redact was passed. Returns (possibly new) list."""
-    if not args.redact:
+def _apply_redaction(segments, enabled, names=None):
+    """Apply PII redaction if enabled (--redact). Returns (possibly new) list.
+
+    names is the already-split --redact-names list, see _split_names().
+    """
+    if not enabled:
         return segments
-    names = ([n.strip() for n in args.redact_names.split(",")]
-             if args.redact_names else None)
+    from . import redact as _redact
+
     return _redact.redact(segments, extra_names=names)
 
 
-def _call_summarize(segments, args):
-    """Call the LLM summarize pipeline, handling common errors."""
+def _check_endpoint(args):
+    """Fail fast if the LLM endpoint is remote and --allow-remote is missing.
+
+    Runs before transcription so the policy error doesn't wait on it.
+    """
+    from . import summarize as _summarize
+
+    try:
+        _summarize.check_endpoint(args.base_url, args.allow_remote)
+    except _summarize.RemoteEndpointError as e:
+        _die(str(e))
+
+
+def _call_summarize(segments, args, client=None):
+    """Call the LLM summarize pipeline, handling common errors.
+
+    With --stream, the summary is written to stdout as it is generated
+    and None is returned.
+    """
+    import httpx
+
+    from . import summarize as _summarize
+
     _progress("Summarizing...")
+    stream = getattr(args, "stream", False)
     try:
-        return _summarize.summarize(
+        result = _summarize.summarize(
             segments,
             args.template,
             client_name=args.client_name,
@@ -197,8 +371,20 @@ def _call_summarize(segments, args):
             model=args.llm_model,
             api_key=args.api_key,
             allow_remote=args.allow_remote,
+            cache=getattr(args, "cache", False),
+            cache_ttl=_cache_ttl(args),
+            client=client,
+            stream=stream,
         )
-    except RemoteEndpointError as e:
+        if not stream:
+            return result
+        # Errors from a streamed request surface while iterating, so the
+        # loop stays inside the try.
+        for chunk in result:
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        sys.stdout.write("\n")
+    except _summarize.RemoteEndpointError as e:
         _die(str(e))
     except httpx.ConnectError:
         _die(
@@ -213,7 +399,7 @@ def _call_summarize(segments, args):
 # -- mn-record --------------------------------------------------------------
 
 
-def record():
+def record(argv=None):
     """Record audio from microphone → WAV file path on stdout."""
     p = argparse.ArgumentParser(
         prog="mn-record",
@@ -228,15 +414,20 @@ def record():
     p.add_argument("--duration", type=float, default=None,
                    help="max duration in seconds (default: until Ctrl-C)")
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
 
-    path = _record.record(
-        output_path=args.output,
-        sample_rate=args.sample_rate,
-        channels=args.channels,
-        duration=args.duration,
-    )
+    from . import record as _record
+
+    try:
+        path = _record.record(
+            output_path=args.output,
+            sample_rate=args.sample_rate,
+            channels=args.channels,
+            duration=args.duration,
+        )
+    except (OSError, RuntimeError) as e:
+        _die(f"Recording failed: {e}")
     if path is None:
         _die("No audio captured.")
     print(path)
@@ -245,17 +436,16 @@ def record():
 # -- mn-transcribe ----------------------------------------------------------
 
 
-def transcribe():
+def transcribe(argv=None):
     """Audio file → diarized transcript as JSON lines on stdout."""
     p = argparse.ArgumentParser(
         prog="mn-transcribe",
         description="Transcribe audio with speaker diarization.",
+        parents=[_whisper_parent(), _diarization_parent()],
     )
     p.add_argument("audio", help="path to audio file")
-    _add_whisper_args(p)
-    _add_diarization_args(p)
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
     apply_config(args, load_config())
 
@@ -263,13 +453,13 @@ def transcribe():
     _check_hf_token()
 
     segments = _transcribe_audio(args)
-    print(_transcribe.to_jsonl(segments))
+    _emit_lines(_transcribe.iter_jsonl_lines(segments))
 
 
 # -- mn-fmt -----------------------------------------------------------------
 
 
-def fmt():
+def fmt(argv=None):
     """JSON lines on stdin → formatted transcript on stdout."""
     p = argparse.ArgumentParser(
         prog="mn-fmt",
@@ -278,19 +468,19 @@ def fmt():
     p.add_argument("--timestamps", action="store_true",
                    help="include timestamps")
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
 
     segments = _read_stdin_segments()
     if segments is None:
         return
-    print(_fmt.fmt(segments, timestamps=args.timestamps))
+    _emit_blocks(_fmt.iter_fmt(segments, timestamps=args.timestamps))
 
 
 # -- mn-redact --------------------------------------------------------------
 
 
-def redact():
+def redact(argv=None):
     """JSON lines on stdin → redacted JSON lines on stdout."""
     p = argparse.ArgumentParser(
         prog="mn-redact",
@@ -299,74 +489,101 @@ def redact():
     p.add_argument("--names", default=None,
                    help="comma-separated names to redact")
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
 
     segments = _read_stdin_segments()
     if segments is None:
         return
 
-    names = [n.strip() for n in args.names.split(",")] if args.names else None
-    redacted = _redact.redact(segments, extra_names=names)
-    print(_transcribe.to_jsonl(redacted))
+    from . import redact as _redact
+
+    redacted = _redact.redact(segments, extra_names=_split_names(args.names))
+    _emit_lines(_transcribe.iter_jsonl_lines(redacted))
 
 
 # -- mn-edit ----------------------------------------------------------------
 
 
-def edit():
+def edit(argv=None):
     """JSON lines on stdin → open in $EDITOR → corrected JSON lines on stdout."""
     p = argparse.ArgumentParser(
         prog="mn-edit",
         description="Edit transcript in $EDITOR, output corrected JSON lines.",
     )
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
 
     segments = _read_stdin_segments()
     if segments is None:
         return
 
+    from . import edit as _edit
+
     corrected = _edit.edit(segments)
-    print(_transcribe.to_jsonl(corrected))
+    _emit_lines(_transcribe.iter_jsonl_lines(corrected))
 
 
 # -- mn-summarize -----------------------------------------------------------
 
 
-def summarize():
+def summarize(argv=None):
     """JSON lines on stdin + template → summary on stdout."""
     p = argparse.ArgumentParser(
         prog="mn-summarize",
         description="Summarize a transcript using a template and LLM.",
+        parents=[_llm_parent()],
     )
     p.add_argument("--template", required=True,
                    help="path to template file")
-    _add_llm_args(p)
     p.add_argument("--redact", action="store_true",
                    help="redact PII before sending to LLM")
     p.add_argument("--redact-names", default=None,
                    help="comma-separated names to redact")
+    _add_stream_flag(p)
+    _add_cache_flag(p)
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
     apply_config(args, load_config())
 
+    _check_cache_args(args)
+    _check_endpoint(args)
     _check_template(args.template)
 
     segments = _read_stdin_segments()
     if segments is None:
         return
 
-    segments = _apply_redaction(segments, args)
-    print(_call_summarize(segments, args))
+    segments = _apply_redaction(segments, args.redact,
+                                _split_names(args.redact_names))
+    note = _call_summarize(segments, args)
+    if note is not None:
+        print(note)
 
 
 # -- mn-templates -----------------------------------------------------------
 
 
-def templates():
+_TEMPLATE_HEADER_BYTES = 4096
+
+
+def _template_description(path):
+    """First non-empty line of a template (max 72 chars), or "".
+
+    Only the first 4 KiB is read; the header line is always near the top.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_TEMPLATE_HEADER_BYTES)
+    for line in head.decode("utf-8", "replace").splitlines():
+        line = line.strip()
+        if line:
+            return line[:72]
+    return ""
+
+
+def templates(argv=None):
     """List available templates with descriptions."""
     p = argparse.ArgumentParser(
         prog="mn-templates",
@@ -375,7 +592,7 @@ def templates():
     p.add_argument("--dir", default=None,
                    help="template directory (default: built-in templates/)")
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
 
     if args.dir:
@@ -387,25 +604,87 @@ def templates():
         print(f"Template directory not found: {template_dir}", file=sys.stderr)
         sys.exit(1)
 
-    for path in sorted(template_dir.glob("*.txt")):
-        # Extract first non-empty line as description.
-        desc = ""
-        for line in path.read_text().split("\n"):
-            line = line.strip()
-            if line:
-                desc = line[:72]
-                break
-        print(f"  {path.stem:20s} {desc}")
+    with os.scandir(template_dir) as it:
+        paths = sorted(
+            Path(entry.path) for entry in it
+            if entry.name.endswith(".txt") and entry.is_file()
+        )
+    lines = []
+    for path in paths:
+        lines.append(f"  {path.stem:20s} {_template_description(path)}\n")
+    sys.stdout.write("".join(lines))
 
 
 # -- mn-batch ---------------------------------------------------------------
 
 
-def batch():
+def _list_audio(directory, ext):
+    """List files in directory ending in ext → sorted [(path, size), ...].
+
+    One scandir pass; each entry is stat'ed once for its size.
+    """
+    with os.scandir(directory) as it:
+        found = [
+            (Path(entry.path), entry.stat().st_size)
+            for entry in it
+            if entry.name.endswith(ext) and entry.is_file()
+        ]
+    return sorted(found)
+
+
+def _prefetch(path):
+    """Ask the kernel to start reading path into the page cache. Best effort."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _transcribe_one(audio_path, args, redact_names, whisper, diarizer, label,
+                    prefetch=None):
+    """Transcribe and redact one batch file → segments.
+
+    Runs in a worker thread. Failures surface as SystemExit from _die().
+    The file came from _list_audio, so it is known to exist and be non-empty.
+    prefetch names the file that will start after this one; its reads are
+    kicked off now so they overlap with this file's inference.
+    """
+    _progress(f"{label} {audio_path.name}")
+    if prefetch is not None:
+        _prefetch(prefetch)
+
+    # Each worker gets its own Namespace so args.audio never races.
+    file_args = argparse.Namespace(**vars(args))
+    file_args.audio = str(audio_path)
+
+    segments = _transcribe_audio(
+        file_args, _whisper=whisper, _diarizer=diarizer, quiet=True,
+    )
+    return _apply_redaction(segments, args.redact, redact_names)
+
+
+def _summarize_one(segments, args, client, audio_path, output_dir):
+    """Summarize one transcribed batch file → path of the written note."""
+    result = _call_summarize(segments, args, client=client)
+    out_file = output_dir / f"{audio_path.stem}.note.txt"
+    out_file.write_text(result + "\n")
+    return out_file
+
+
+def batch(argv=None):
     """Process a directory of audio files → one note per file."""
     p = argparse.ArgumentParser(
         prog="mn-batch",
         description="Batch-process audio files into notes.",
+        parents=[_whisper_parent(), _diarization_parent(), _llm_parent()],
     )
     p.add_argument("directory", help="directory containing audio files")
     p.add_argument("--template", required=True,
@@ -414,25 +693,37 @@ def batch():
                    help="audio file extension to match (default: .wav)")
     p.add_argument("--output-dir", default=None,
                    help="output directory for notes (default: same as input)")
-    _add_whisper_args(p)
-    _add_diarization_args(p)
-    _add_llm_args(p)
+    p.add_argument("--jobs", type=int, default=1,
+                   help="number of files to process in parallel (default: 1)")
+    p.add_argument("--max-concurrent-summaries", type=int, default=1,
+                   help="number of LLM requests in flight at once (default: 1)")
     p.add_argument("--redact", action="store_true",
                    help="redact PII before sending to LLM")
     p.add_argument("--redact-names", default=None,
                    help="comma-separated names to redact")
     p.add_argument("--transcript-only", action="store_true",
                    help="output transcripts only, skip summarization")
+    _add_cache_flag(p)
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
     apply_config(args, load_config())
 
+    if args.jobs < 1:
+        _die("--jobs must be at least 1")
+    if args.max_concurrent_summaries < 1:
+        _die("--max-concurrent-summaries must be at least 1")
+    _check_cache_args(args)
+    if not args.transcript_only:
+        _check_endpoint(args)
     _check_template(args.template)
     _check_hf_token()
 
     audio_dir = Path(args.directory)
-    files = sorted(audio_dir.glob(f"*{args.ext}"))
+    try:
+        files = _list_audio(audio_dir, args.ext)
+    except OSError as e:
+        _die(f"Cannot read directory {audio_dir}: {e.strerror}")
 
     if not files:
         _die(f"No {args.ext} files in {audio_dir}")
@@ -440,41 +731,100 @@ def batch():
     output_dir = Path(args.output_dir) if args.output_dir else audio_dir
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Pre-load models once for the whole batch.
+    # Pre-load models once for the whole batch; workers share them.
+    # The two loads are independent (weights from disk or network, then
+    # native init), so run them side by side: start-up costs the slower
+    # of the two rather than their sum.
     _progress("Loading models...")
-    try:
-        whisper = _transcribe.load_whisper(
+    with ThreadPoolExecutor(max_workers=2) as loader:
+        # One whisper worker per job, so concurrent files don't queue
+        # behind each other inside the shared model.
+        whisper_future = loader.submit(
+            _transcribe.load_whisper,
             args.model, args.device, args.compute_type,
+            num_workers=args.jobs,
         )
-        diarizer = _transcribe.load_diarizer()
+        diarizer_future = loader.submit(_transcribe.load_diarizer)
+    try:
+        whisper = whisper_future.result()
+        diarizer = diarizer_future.result()
     except (OSError, RuntimeError, ValueError) as e:
         _die(f"Failed to load models: {e}")
 
-    failed = []
-    for i, audio_path in enumerate(files, 1):
-        _progress(f"[{i}/{len(files)}] {audio_path.name}")
-        _check_audio_file(audio_path)
-        args.audio = str(audio_path)
-
-        try:
-            segments = _transcribe_audio(
-                args, _whisper=whisper, _diarizer=diarizer, quiet=True,
-            )
-
-            segments = _apply_redaction(segments, args)
+    # Name lists are the same for every file; split them once.
+    redact_names = _split_names(args.redact_names)
+    args.speakers = _split_names(args.speakers)
 
-            if args.transcript_only:
-                out_file = output_dir / f"{audio_path.stem}.txt"
-                out_file.write_text(_fmt.fmt(segments, timestamps=True) + "\n")
-            else:
-                result = _call_summarize(segments, args)
-                out_file = output_dir / f"{audio_path.stem}.note.txt"
-                out_file.write_text(result + "\n")
-        except SystemExit:
-            failed.append(audio_path.name)
-            continue
+    # Transcription runs on up to --jobs threads; summaries go to a
+    # separate pool of --max-concurrent-summaries threads so the LLM round
+    # trip for one file overlaps with transcription of the next. All
+    # summaries share one HTTP client, so the connection to the LLM
+    # endpoint is kept alive (multiplexed over HTTP/2 if h2 is installed).
+    if args.transcript_only:
+        http = contextlib.nullcontext()
+    else:
+        from . import summarize as _summarize
 
-        _progress(f"  → {out_file}")
+        http = _summarize.make_client()
+    # Progress from concurrent workers is coalesced into one write a second.
+    failed = []
+    with _log.buffered(), http as client, \
+            ThreadPoolExecutor(max_workers=args.jobs) as pool, \
+            ThreadPoolExecutor(
+                max_workers=args.max_concurrent_summaries) as llm_pool:
+        pending = {}
+        try:
+            for i, (audio_path, size) in enumerate(files, 1):
+                label = f"[{i}/{len(files)}]"
+                if size == 0:
+                    _progress(
+                        f"{label} {audio_path.name}: empty file, skipping")
+                    failed.append(audio_path.name)
+                    continue
+                ahead = i - 1 + args.jobs
+                prefetch = files[ahead][0] if ahead < len(files) else None
+                future = pool.submit(_transcribe_one, audio_path, args,
+                                     redact_names, whisper, diarizer, label,
+                                     prefetch)
+                pending[future] = ("transcribe", i, audio_path)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Handle finished work in file order so summaries queue up
+                # in the same order the files were listed.
+                for future in sorted(done, key=lambda f: pending[f][1]):
+                    stage, i, audio_path = pending.pop(future)
+                    try:
+                        result = future.result()
+                        if stage == "transcribe" and args.transcript_only:
+                            out_file = output_dir / f"{audio_path.stem}.txt"
+                            out_file.write_text(
+                                _fmt.fmt(result, timestamps=True) + "\n")
+                        elif stage == "transcribe":
+                            summary = llm_pool.submit(
+                                _summarize_one, result, args, client,
+                                audio_path, output_dir)
+                            pending[summary] = ("summarize", i, audio_path)
+                            continue
+                        else:
+                            out_file = result
+                    except SystemExit:
+                        # Already reported by _die().
+                        failed.append(audio_path.name)
+                        continue
+                    except Exception as e:
+                        # One bad file (a timeout, a malformed LLM reply,
+                        # a full disk) must not cost the rest of the batch.
+                        _log.error(f"Error: {audio_path.name}: {e}")
+                        failed.append(audio_path.name)
+                        continue
+                    _progress(f"  → {out_file}")
+        except BaseException:
+            # Ctrl-C or an unexpected error: drop queued files instead of
+            # letting the pools' exit transcribe them all and discard the
+            # results. Only work already running is waited for.
+            pool.shutdown(cancel_futures=True)
+            llm_pool.shutdown(cancel_futures=True)
+            raise
 
     if failed:
         _progress(f"Warning: {len(failed)} file(s) failed: {', '.join(failed)}")
@@ -484,38 +834,44 @@ def batch():
 # -- mn (main) --------------------------------------------------------------
 
 
-def main():
+def main(argv=None):
     """Composed pipeline: audio file → note on stdout."""
     p = argparse.ArgumentParser(
         prog="mn",
         description="Transcribe, diarize, and summarize audio to notes.",
+        parents=[_whisper_parent(), _diarization_parent(), _llm_parent()],
     )
     p.add_argument("audio", help="path to audio file")
     p.add_argument("--template", required=True,
                    help="path to template file")
-    _add_whisper_args(p)
-    _add_diarization_args(p)
-    _add_llm_args(p)
     p.add_argument("--redact", action="store_true",
                    help="redact PII before sending to LLM")
     p.add_argument("--redact-names", default=None,
                    help="comma-separated names to redact")
     p.add_argument("--transcript-only", action="store_true",
                    help="print formatted transcript, skip summarization")
+    _add_stream_flag(p)
+    _add_cache_flag(p)
     _add_verbose_flag(p)
-    args = p.parse_args()
+    args = p.parse_args(argv)
     _init_logging(args)
     apply_config(args, load_config())
 
+    _check_cache_args(args)
+    if not args.transcript_only:
+        _check_endpoint(args)
     _check_audio_file(args.audio)
     _check_template(args.template)
     _check_hf_token()
 
     segments = _transcribe_audio(args)
-    segments = _apply_redaction(segments, args)
+    segments = _apply_redaction(segments, args.redact,
+                                _split_names(args.redact_names))
 
     if args.transcript_only:
-        print(_fmt.fmt(segments, timestamps=True))
+        _emit_blocks(_fmt.iter_fmt(segments, timestamps=True))
         return
 
-    print(_call_summarize(segments, args))
+    note = _call_summarize(segments, args)
+    if note is not None:
+        print(note)
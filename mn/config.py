@@ -5,6 +5,9 @@ Searches for config in this order (first found wins):
     1. ./mn.toml          (project-local)
     2. ~/.config/mn.toml  (user-level)
 
+Set $MN_CONFIG to a file path to use that file instead of searching.
+If that file is missing, a warning is printed and no config is loaded.
+
 Config is TOML format:
 
     [transcribe]
@@ -28,9 +31,13 @@ Config is TOML format:
 CLI flags always override config file values.
 """
 
+import functools
 import os
+import stat
 from pathlib import Path
 
+from . import log as _log
+
 try:
     import tomllib  # Python 3.11+
 except ModuleNotFoundError:
@@ -42,6 +49,9 @@ except ModuleNotFoundError:
 
 def _search_paths():
     """Return config search paths, evaluated at call time."""
+    explicit = os.environ.get("MN_CONFIG")
+    if explicit:
+        return [Path(explicit)]
     return [
         Path("mn.toml"),
         Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "mn.toml",
@@ -50,115 +60,131 @@ def _search_paths():
 
 def find_config():
     """Return the path to the first config file found, or None."""
+    return _find_config()[0]
+
+
+def _find_config():
+    """First config file found → (path, stat_result), or (None, None)."""
     for p in _search_paths():
-        if p.is_file():
-            return p
-    return None
+        st = _stat_file(p)
+        if st is not None:
+            return p, st
+    explicit = os.environ.get("MN_CONFIG")
+    if explicit:
+        # The user named this file; running without its redaction and
+        # endpoint settings must not go unnoticed.
+        _log.warn(f"Warning: MN_CONFIG file not found: {explicit}; "
+                  f"running without a config file.")
+    return None, None
+
+
+def _stat_file(path):
+    """stat() a path, or None if it is missing or not a regular file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
 
 
 def load_config(path=None):
-    """Load config from a TOML file. Returns a dict (empty if no file/parser)."""
-    if path is None:
-        path = find_config()
-    if path is None:
-        return {}
-    if tomllib is None:
-        return {}
+    """Load config from a TOML file. Returns a dict (empty if no file/parser).
 
-    path = Path(path)
-    if not path.is_file():
+    Parses are memoized per file, modification time, and size, so repeated
+    calls in one process skip the TOML parse. Treat the result as read-only.
+    """
+    if tomllib is None:
         return {}
+    if path is None:
+        path, st = _find_config()
+        if path is None:
+            return {}
+    else:
+        st = _stat_file(path)
+        if st is None:
+            return {}
 
     try:
-        with open(path, "rb") as f:
-            return tomllib.load(f)
+        return _parse_toml(os.path.abspath(path), st.st_mtime_ns, st.st_size)
     except Exception as e:
-        from . import log as _log
         _log.warn(f"Warning: could not parse {path}: {e}")
         return {}
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_toml(path, mtime_ns, size):
+    """Parse a TOML file. mtime_ns and size are part of the cache key only."""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
 def apply_config(args, config):
     """Apply config defaults to an argparse Namespace.
 
     Only sets values that are still at their argparse defaults (None or False).
     CLI flags always win.
     """
-    transcribe_cfg = config.get("transcribe", {})
-    summarize_cfg = config.get("summarize", {})
-    redact_cfg = config.get("redact", {})
-
-    # Map config keys → argparse attribute names.
-    _apply_section(args, transcribe_cfg, {
-        "model": "model",
-        "device": "device",
-        "compute_type": "compute_type",
-        "num_speakers": "num_speakers",
-        "min_speakers": "min_speakers",
-        "max_speakers": "max_speakers",
-        "speakers": "speakers",
-    })
-
-    _apply_section(args, summarize_cfg, {
-        "template": "template",
-        "base_url": "base_url",
-        "model": "llm_model",
-        "api_key": "api_key",
-        "client_name": "client_name",
-        "session_date": "session_date",
-    })
-
-    # Boolean flags (store_true defaults to False, not None, so
-    # _apply_section's "is not None" guard would always skip them).
-    if summarize_cfg.get("allow_remote") and hasattr(args, "allow_remote"):
-        if not args.allow_remote:
-            args.allow_remote = True
-
-    # Redaction config.
-    if redact_cfg.get("enabled") and hasattr(args, "redact") and not args.redact:
-        args.redact = True
-    if redact_cfg.get("names") and hasattr(args, "redact_names"):
-        if args.redact_names is None:
-            args.redact_names = redact_cfg["names"]
-
-
-# Expected types for config keys.  Used to reject obviously wrong values
-# like `num_speakers = "two"` before they cause cryptic downstream errors.
-_EXPECTED_TYPES = {
-    "model": str,
-    "device": str,
-    "compute_type": str,
-    "num_speakers": int,
-    "min_speakers": int,
-    "max_speakers": int,
-    "speakers": str,
-    "template": str,
-    "base_url": str,
-    "api_key": str,
-    "client_name": str,
-    "session_date": str,
-    "names": str,
-    "allow_remote": bool,
-}
-
-
-def _apply_section(args, section, mapping):
-    """Apply a config section to args. Only fills in None/unset values."""
-    for config_key, attr_name in mapping.items():
-        if not hasattr(args, attr_name):
+    for section, entries in _SPEC.items():
+        cfg = config.get(section)
+        if not cfg:
             continue
-        current = getattr(args, attr_name)
-        if current is not None:
-            continue
-        if config_key in section:
-            value = section[config_key]
-            expected = _EXPECTED_TYPES.get(config_key)
-            if expected is not None and not isinstance(value, expected):
-                from . import log as _log
+        for key, attr, expected in entries:
+            if key not in cfg or not hasattr(args, attr):
+                continue
+            value = cfg[key]
+            if not isinstance(value, expected) and value and \
+                    (section, key) in _FAIL_CLOSED:
                 _log.warn(
-                    f"Warning: config key '{config_key}' should be "
+                    f"Warning: config key '{key}' should be bool, got "
+                    f"{type(value).__name__}; treating {value!r} as true."
+                )
+                value = True
+            if not isinstance(value, expected):
+                _log.warn(
+                    f"Warning: config key '{key}' should be "
                     f"{expected.__name__}, got {type(value).__name__}; "
                     f"ignoring."
                 )
                 continue
-            setattr(args, attr_name, value)
+            if expected is bool:
+                # store_true flags default to False, not None: config can
+                # only turn them on, never off.
+                if value and not getattr(args, attr):
+                    setattr(args, attr, True)
+            elif getattr(args, attr) is None:
+                setattr(args, attr, value)
+
+
+# section → (config key, argparse attribute, expected type).  Types reject
+# obviously wrong values like `num_speakers = "two"` before they cause
+# cryptic downstream errors.  bool entries are store_true flags.
+# Privacy switches must fail closed. A mistyped value such as
+# `enabled = 1` or "yes" turns redaction on (truthiness, as before the
+# type checks) instead of being ignored and leaving PII unredacted.
+_FAIL_CLOSED = {("redact", "enabled")}
+
+_SPEC = {
+    "transcribe": (
+        ("model", "model", str),
+        ("device", "device", str),
+        ("compute_type", "compute_type", str),
+        ("batch_size", "batch_size", int),
+        ("num_speakers", "num_speakers", int),
+        ("min_speakers", "min_speakers", int),
+        ("max_speakers", "max_speakers", int),
+        ("speakers", "speakers", str),
+    ),
+    "summarize": (
+        ("template", "template", str),
+        ("base_url", "base_url", str),
+        ("model", "llm_model", str),
+        ("api_key", "api_key", str),
+        ("client_name", "client_name", str),
+        ("session_date", "session_date", str),
+        ("allow_remote", "allow_remote", bool),
+    ),
+    "redact": (
+        ("enabled", "redact", bool),
+        ("names", "redact_names", str),
+    ),
+}
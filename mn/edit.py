@@ -28,68 +28,64 @@ from .transcribe import Segment
 
 def to_editable(segments):
     """Segments → human-editable text (round-trippable)."""
-    blocks = []
+    return "".join(_iter_editable(segments))
+
+
+def _iter_editable(segments):
+    """Segments → chunks of to_editable()'s text, lazily."""
+    sep = ""
     for s in segments:
-        header = f"[{_ftime(s.start)} → {_ftime(s.end)}] {s.speaker}:"
-        blocks.append(f"{header}\n{s.text}")
-    return "\n\n".join(blocks) + "\n"
+        yield f"{sep}[{_ftime(s.start)} → {_ftime(s.end)}] {s.speaker}:\n{s.text}"
+        sep = "\n\n"
+    yield "\n"
 
 
 # -- Parse back from editable format ----------------------------------------
 
+# Matched over the whole text (MULTILINE); [ \t] rather than \s so a
+# match never runs across a line break.
 _HEADER = re.compile(
-    r"^\[(\d+:\d+)\s*→\s*(\d+:\d+)\]\s*(.+?)\s*:$"
+    r"^\[(\d+):(\d+)[ \t]*→[ \t]*(\d+):(\d+)\][ \t]*(.+?)[ \t]*:$",
+    re.MULTILINE,
 )
 
 
-def _parse_time(ts):
-    """MM:SS → float seconds."""
-    parts = ts.split(":")
-    if len(parts) != 2:
-        raise ValueError(f"Invalid timestamp format (expected MM:SS): {ts!r}")
-    try:
-        return int(parts[0]) * 60 + int(parts[1])
-    except ValueError:
-        raise ValueError(f"Invalid timestamp format (expected MM:SS): {ts!r}")
-
-
 def from_editable(text):
     """Human-editable text → list of Segments.
 
     Splits on header lines rather than blank lines, so body text can
     safely contain blank lines without breaking the parse.
     """
-    segments = []
-    lines = text.split("\n")
-
-    # Collect (header_match, start_line_index) pairs.
-    headers = []
-    for i, line in enumerate(lines):
-        m = _HEADER.match(line)
-        if m:
-            headers.append((m, i))
-
-    for idx, (m, start_i) in enumerate(headers):
-        # Body extends from line after header to line before next header.
-        if idx + 1 < len(headers):
-            end_i = headers[idx + 1][1]
-        else:
-            end_i = len(lines)
-
-        body = "\n".join(lines[start_i + 1:end_i]).strip()
-        segments.append(Segment(
-            m.group(3).strip(),
-            body,
-            float(_parse_time(m.group(1))),
-            float(_parse_time(m.group(2))),
-        ))
-
-    return segments
+    headers = list(_HEADER.finditer(text))
+    # Body extends from the end of one header line to the next header.
+    ends = [m.start() for m in headers[1:]] + [len(text)]
+
+    return [
+        Segment(
+            m.group(5).strip(),
+            text[m.end():end].strip(),
+            float(int(m.group(1)) * 60 + int(m.group(2))),
+            float(int(m.group(3)) * 60 + int(m.group(4))),
+        )
+        for m, end in zip(headers, ends)
+    ]
 
 
 # -- Editor launcher --------------------------------------------------------
 
 
+def _tmp_root():
+    """Where to put the edit temp dir: $XDG_RUNTIME_DIR if usable, else default.
+
+    XDG_RUNTIME_DIR is a per-user, owner-only tmpfs on systemd systems, so
+    the transcript stays in RAM and is never written to a persistent disk.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return runtime
+    return None
+
+
 def edit(segments):
     """Open segments in $EDITOR, return corrected segments."""
     editor = os.environ.get("EDITOR", "vi")
@@ -98,17 +94,18 @@ def edit(segments):
         raise FileNotFoundError(
             f"Editor {editor!r} not found. Set $EDITOR to a valid command."
         )
-    text = to_editable(segments)
 
     # Create a private temp directory so the transcript is never
     # world-readable — important for clinical data.
-    tmp_dir = tempfile.mkdtemp(prefix="mn-edit-")
+    tmp_dir = tempfile.mkdtemp(prefix="mn-edit-", dir=_tmp_root())
     tmp = os.path.join(tmp_dir, "transcript.txt")
     fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
-    with os.fdopen(fd, "w") as f:
-        f.write(text)
 
     try:
+        # segments may be a lazy stream; write it out inside the try so
+        # a parse error mid-stream still removes the partial file.
+        with os.fdopen(fd, "w") as f:
+            f.writelines(_iter_editable(segments))
         subprocess.run([resolved, tmp], check=True)
         with open(tmp) as f:
             edited = f.read()
@@ -12,7 +12,16 @@ from .transcribe import Segment
 
 def fmt(segments, timestamps=False):
     """Segments → readable multi-party transcript string."""
-    return "\n\n".join(_format_line(s, timestamps) for s in segments)
+    return "\n\n".join(iter_fmt(segments, timestamps))
+
+
+def iter_fmt(segments, timestamps=False):
+    """Segments → formatted lines, one per segment, lazily.
+
+    Joining the lines with blank lines gives fmt()'s output.
+    """
+    for s in segments:
+        yield _format_line(s, timestamps)
 
 
 def _format_line(seg, timestamps):
@@ -21,7 +30,14 @@ def _format_line(seg, timestamps):
     return f"{seg.speaker}: {seg.text}"
 
 
+# "00".."59", so the common case formats by table lookup.
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(60))
+
+
 def _ftime(seconds):
     """Seconds → MM:SS."""
-    m, s = divmod(int(seconds), 60)
-    return f"{m:02d}:{s:02d}"
+    t = int(seconds)
+    m = t // 60
+    if 0 <= m < 60:
+        return f"{_TWO_DIGITS[m]}:{_TWO_DIGITS[t % 60]}"
+    return f"{m:02d}:{_TWO_DIGITS[t % 60]}"
@@ -7,12 +7,15 @@ All stderr output goes through this module so users can control noise:
     MN_VERBOSE=2   errors + warnings + progress
 
 CLI tools call configure() once at startup. Library code uses the
-module-level functions: error(), warn(), progress().
+module-level functions: error(), warn(), progress(). Long-running loops
+can wrap themselves in buffered() to batch progress output.
 """
 
+import contextlib
 import logging
 import os
 import sys
+import threading
 
 _logger = logging.getLogger("mn")
 
@@ -27,6 +30,13 @@ _LEVEL_MAP = {
 }
 
 
+class _MessageFormatter(logging.Formatter):
+    """Formatter that returns the bare message, without format-string work."""
+
+    def format(self, record):
+        return record.getMessage()
+
+
 class _StderrHandler(logging.StreamHandler):
     """Handler that writes plain messages to stderr (no timestamp/level prefix).
 
@@ -37,12 +47,34 @@ class _StderrHandler(logging.StreamHandler):
     def __init__(self):
         # Don't lock to a specific stream at init time.
         super().__init__(sys.stderr)
-        self.setFormatter(logging.Formatter("%(message)s"))
+        self.setFormatter(_MessageFormatter())
+        self._pending = None  # list of lines while buffered(), else None
 
     def emit(self, record):
         # Resolve current sys.stderr each time, not the one captured at init.
-        self.stream = sys.stderr
-        super().emit(record)
+        current = sys.stderr
+        if self.stream is not current:
+            self.stream = current
+        if self._pending is None:
+            super().emit(record)
+        elif record.levelno >= logging.WARNING:
+            # Warnings and errors go out at once, after what came before.
+            self._drain()
+            super().emit(record)
+        else:
+            self._pending.append(self.format(record) + self.terminator)
+
+    def _drain(self):
+        """Write pending lines in one call. Caller holds self.lock."""
+        if self._pending:
+            self.stream = sys.stderr
+            self.stream.write("".join(self._pending))
+            self.stream.flush()
+            self._pending.clear()
+
+    def drain(self):
+        with self.lock:
+            self._drain()
 
 
 def configure(verbose=None):
@@ -63,6 +95,38 @@ def configure(verbose=None):
     _logger.propagate = False
 
 
+@contextlib.contextmanager
+def buffered(interval=1.0):
+    """Coalesce progress output into at most one stderr write per interval.
+
+    Progress lines are held for up to interval seconds; warnings and
+    errors flush anything held and are written immediately. Everything
+    is written out when the block exits.
+    """
+    handlers = [h for h in _logger.handlers if isinstance(h, _StderrHandler)]
+    for h in handlers:
+        with h.lock:
+            h._pending = []
+    stop = threading.Event()
+
+    def flusher():
+        while not stop.wait(interval):
+            for h in handlers:
+                h.drain()
+
+    thread = threading.Thread(target=flusher, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+        for h in handlers:
+            with h.lock:
+                h._drain()
+                h._pending = None
+
+
 # Auto-configure with defaults so messages work even without explicit
 # configure() call (e.g. in library usage or tests).
 configure()
@@ -6,8 +6,10 @@ Composable: mn-record | xargs mn-transcribe
 Requires: pip install sounddevice soundfile
 """
 
+import queue
 import signal
 import tempfile
+import threading
 from pathlib import Path
 
 from . import log as _log
@@ -28,13 +30,34 @@ def record(output_path=None, sample_rate=16000, channels=1, duration=None):
         fd.close()
 
     output_path = str(output_path)
-    frames = []
+    # The audio callback only queues a copy of each block; a writer thread
+    # appends them to the WAV as they arrive. Memory stays bounded however
+    # long the session runs, and the file is complete when capture stops.
+    # If a write fails (disk full, device gone), the user is told at once
+    # and capture stops: the file keeps what was written before the
+    # failure, and blocks captured after it are discarded.
+    blocks = queue.SimpleQueue()
+    written = 0
+    errors = []
     stop = False
 
     def _callback(indata, frame_count, time_info, status):
         if status:
             _log.warn(str(status))
-        frames.append(indata.copy())
+        blocks.put(indata.copy())
+
+    def _writer(f):
+        nonlocal written
+        while (block := blocks.get()) is not None:
+            if errors:
+                continue  # keep draining so capture never blocks
+            try:
+                f.write(block)
+                written += len(block)
+            except Exception as e:
+                errors.append(e)
+                _log.warn(f"Warning: could not write audio ({e}); stopping. "
+                          f"Audio from this point on is not saved.")
 
     def _stop(sig, frame):
         nonlocal stop
@@ -45,24 +68,37 @@ def record(output_path=None, sample_rate=16000, channels=1, duration=None):
     _log.progress(f"Recording → {output_path}  (Ctrl-C to stop)")
 
     try:
-        with sd.InputStream(samplerate=sample_rate, channels=channels,
-                            callback=_callback):
-            if duration:
-                sd.sleep(int(duration * 1000))
-            else:
-                while not stop:
-                    sd.sleep(100)
+        with sf.SoundFile(output_path, mode="w", samplerate=sample_rate,
+                          channels=channels) as f:
+            writer = threading.Thread(target=_writer, args=(f,), daemon=True)
+            writer.start()
+            try:
+                with sd.InputStream(samplerate=sample_rate, channels=channels,
+                                    callback=_callback):
+                    # Short sleeps so Ctrl-C or a failed write ends
+                    # capture promptly, with or without --duration.
+                    remaining = int(duration * 1000) if duration else None
+                    while not stop and not errors:
+                        step = 100 if remaining is None else min(100, remaining)
+                        if step <= 0:
+                            break
+                        sd.sleep(step)
+                        if remaining is not None:
+                            remaining -= step
+            finally:
+                blocks.put(None)
+                writer.join()
     finally:
         signal.signal(signal.SIGINT, prev_handler)
 
-    if not frames:
+    if errors:
+        raise errors[0]
+    if not written:
         _log.warn("No audio captured.")
+        Path(output_path).unlink(missing_ok=True)
         return None
 
-    import numpy as np
-    audio = np.concatenate(frames, axis=0)
-    sf.write(output_path, audio, sample_rate)
-    seconds = len(audio) / sample_rate
+    seconds = written / sample_rate
     m, s = divmod(int(seconds), 60)
     _log.progress(f"Saved {m}:{s:02d} of audio.")
     return output_path
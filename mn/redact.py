@@ -8,6 +8,7 @@ Redacts: phone numbers, SSNs, email addresses, dates of birth,
 street addresses (heuristic), and names (when provided via --names).
 """
 
+import functools
 import re
 
 from .transcribe import Segment
@@ -15,7 +16,7 @@ from .transcribe import Segment
 
 # -- Patterns ---------------------------------------------------------------
 
-_PATTERNS = [
+_PATTERNS = (
     # US phone numbers
     (re.compile(
         r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"
@@ -28,14 +29,117 @@ _PATTERNS = [
     (re.compile(
         r"\b\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}\b"
     ), "[DATE]"),
-    # Street addresses (number + street name + suffix)
+    # Street addresses (number + street name + suffix).  Same matches as
+    # \d{1,5}\s+[\w\s]{1,30}suffix, but the name must start with a word
+    # character, so \s+ and [\w\s] can't split a run of whitespace between
+    # them (that backtracked quadratically); a name of spaces only is its
+    # own alternative.
     (re.compile(
-        r"\b\d{1,5}\s+[\w\s]{1,30}"
+        r"\b\d{1,5}(?:\s+\w[\w\s]{0,29}|\s{2,})"
         r"(?:street|st|avenue|ave|boulevard|blvd|drive|dr|lane|ln"
         r"|road|rd|court|ct|place|pl|way|circle|cir)\b",
         re.IGNORECASE,
     ), "[ADDRESS]"),
-]
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _passes(names):
+    """(pattern, tag) pairs in priority order; names, if any, go last."""
+    if not names:
+        return _PATTERNS
+    name_pattern = re.compile(rf"(?i:\b{_trie_regex(names)}\b)")
+    return _PATTERNS + ((name_pattern, "[NAME]"),)
+
+
+def _trie_regex(names):
+    """Alternation over names with shared prefixes factored out.
+
+    ["Ann", "Anna", "Bob"] → (?:Ann(?:a)?|Bob). The regex engine tries
+    alternatives one by one, so a flat list of N names costs N attempts
+    at every position; the trie rejects a non-matching position after
+    one character. Longer names are tried before their prefixes.
+    """
+    trie = {}
+    for name in names:
+        node = trie
+        for ch in name:
+            low = ch.lower()
+            node = node.setdefault(low if len(low) == 1 else ch, {})
+        node[""] = {}
+    return _node_regex(trie)
+
+
+def _node_regex(node):
+    alts = [re.escape(ch) + _node_regex(child)
+            for ch, child in sorted(node.items()) if ch]
+    if not alts:
+        return ""
+    if len(alts) == 1 and "" not in node:
+        return alts[0]
+    group = "(?:" + "|".join(alts) + ")"
+    return group + "?" if "" in node else group
+
+
+def _normalize_names(names):
+    """Strip, drop empties and dedupe, in a stable order (a cache key)."""
+    if not names:
+        return ()
+    unique = {n.strip() for n in names} - {""}
+    return tuple(sorted(unique, key=lambda n: (-len(n), n)))
+
+
+# Joins segment texts in redact(); see there.
+_SEP = "\x00"
+
+
+def _merge(spans, matches, tag):
+    """Merge one pass's matches into the spans of earlier passes.
+
+    Both lists are sorted and disjoint, so one sweep does it.
+    """
+    out, k, n = [], 0, len(spans)
+    for s, e in matches:
+        while k < n and spans[k][1] <= s:
+            out.append(spans[k])
+            k += 1
+        m = k
+        while m < n and spans[m][0] < e:
+            m += 1
+        if m > k:
+            lo, hi = spans[k][0], spans[m - 1][1]
+            if lo < s or hi > e or hi - lo == e - s:
+                continue
+        out.append((s, e, tag))
+        k = m
+    out.extend(spans[k:])
+    return out
+
+
+def _sub_all(text, passes):
+    """Replace every match of passes in text, earlier passes first.
+
+    Matches are collected as spans over the original text, so tags are
+    never rescanned (a name like "phone" leaves [PHONE] alone). Where a
+    later pass overlaps an earlier match, the earlier match wins:
+    "1/2/555 123 4567" is "1/2/[PHONE]", not "[DATE] 123 4567". The one
+    exception is a later match that contains every match it overlaps;
+    it covers strictly more text, so "j.5551234567@example.com" becomes
+    one [EMAIL] rather than leaking the domain.
+    """
+    spans = []  # disjoint (start, end, tag), sorted
+    for pattern, tag in passes:
+        matches = [m.span() for m in pattern.finditer(text)]
+        if matches:
+            spans = _merge(spans, matches, tag)
+    if not spans:
+        return text
+    out, pos = [], 0
+    for s, e, tag in spans:
+        out += (text[pos:s], tag)
+        pos = e
+    out.append(text[pos:])
+    return "".join(out)
 
 
 # -- Core -------------------------------------------------------------------
@@ -43,27 +147,24 @@ _PATTERNS = [
 
 def redact_text(text, extra_names=None):
     """Apply PII patterns to a string, returning redacted version."""
-    result = text
-    for pattern, replacement in _PATTERNS:
-        result = pattern.sub(replacement, result)
-
-    # Redact specific names if provided.
-    if extra_names:
-        for name in extra_names:
-            name = name.strip()
-            if name:
-                result = re.sub(
-                    r"\b" + re.escape(name) + r"\b",
-                    "[NAME]",
-                    result,
-                    flags=re.IGNORECASE,
-                )
-    return result
+    return _sub_all(text, _passes(_normalize_names(extra_names)))
 
 
 def redact(segments, extra_names=None):
-    """Redact PII from a list of Segments. Returns new list."""
+    """Redact PII from a list of Segments. Returns new list.
+
+    All texts are joined and scanned once per pattern, then split back.
+    NUL is neither a word character nor whitespace, so no pattern can
+    match across it and \\b behaves as it would at a string edge.
+    """
+    segments = list(segments)
+    texts = [s.text for s in segments]
+    passes = _passes(_normalize_names(extra_names))
+    if any(_SEP in t for t in texts):
+        redacted = [_sub_all(t, passes) for t in texts]
+    else:
+        redacted = _sub_all(_SEP.join(texts), passes).split(_SEP)
     return [
-        Segment(s.speaker, redact_text(s.text, extra_names), s.start, s.end)
-        for s in segments
+        Segment(s.speaker, text, s.start, s.end)
+        for s, text in zip(segments, redacted)
     ]
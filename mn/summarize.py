@@ -18,6 +18,8 @@ Configure via environment or CLI flags:
     MN_API_KEY   (default: ollama)
 """
 
+import functools
+import importlib.util
 import json
 import os
 from datetime import date
@@ -28,6 +30,7 @@ from urllib.parse import urlparse
 
 import httpx
 
+from . import cache as _cache
 from . import log as _log
 
 # Rough chars-per-token ratio for English text. Used for warnings only.
@@ -41,30 +44,53 @@ from .transcribe import Segment
 
 
 def load_template(path):
-    """Read a template file from disk."""
+    """Read a template file from disk.
+
+    Cached on (path, mtime, size): mn-batch reads the template once for
+    the whole run, and an edited file is still picked up.
+    """
+    st = os.stat(path)
+    return _read_template(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_template(path, mtime_ns, size):
+    """mtime_ns and size are part of the cache key only."""
     return Path(path).read_text()
 
 
-def _duration(segments):
-    """Compute human-readable duration from segment timestamps."""
-    if not segments:
-        return "0:00"
-    start = min(s.start for s in segments)
-    end = max(s.end for s in segments)
+def _span(start, end):
+    """Seconds from start to end → "M:SS"."""
     total = int(end - start)
     m, s = divmod(total, 60)
     return f"{m}:{s:02d}"
 
 
 def render(template_text, segments, client_name=None, session_date=None):
-    """Fill $placeholders in a template with transcript data."""
-    transcript = fmt(segments, timestamps=True)
-    speakers = ", ".join(sorted(set(s.speaker for s in segments)))
+    """Fill $placeholders in a template with transcript data.
+
+    segments is walked once: speakers and the time span are tallied
+    while the transcript is formatted, so any iterable works.
+    """
+    speakers = set()
+    start = end = None
+
+    def _tally(segs):
+        nonlocal start, end
+        for s in segs:
+            speakers.add(s.speaker)
+            if start is None or s.start < start:
+                start = s.start
+            if end is None or s.end > end:
+                end = s.end
+            yield s
+
+    transcript = fmt(_tally(segments), timestamps=True)
     return Template(template_text).safe_substitute(
         transcript=transcript,
-        speakers=speakers,
+        speakers=", ".join(sorted(speakers)),
         date=session_date or date.today().isoformat(),
-        duration=_duration(segments),
+        duration="0:00" if start is None else _span(start, end),
         client_name=client_name or "Client",
     )
 
@@ -87,25 +113,71 @@ class RemoteEndpointError(RuntimeError):
     """Raised when a remote LLM endpoint is used without --allow-remote."""
 
 
+def check_endpoint(base_url=None, allow_remote=False):
+    """Resolve the LLM base URL and enforce the remote-endpoint gate.
+
+    Returns the effective base URL ($MN_API_BASE or the local ollama
+    default when base_url is None). Raises RemoteEndpointError if it is
+    non-local and allow_remote is False. Cheap enough to call before any
+    slow work, so a misconfiguration fails in milliseconds.
+    """
+    base_url = base_url or os.environ.get("MN_API_BASE",
+                                           "http://localhost:11434/v1")
+    if not allow_remote and not _is_local(base_url):
+        raise RemoteEndpointError(
+            f"Refusing to send clinical data to remote endpoint "
+            f"({base_url}). Pass --allow-remote to confirm, or use "
+            f"a local LLM (e.g. ollama)."
+        )
+    return base_url
+
+
+def make_client():
+    """An httpx.Client to pass to complete() across many calls.
+
+    Keeps the connection alive between requests. With h2 installed
+    (make-notes[http2]) it negotiates HTTP/2 with HTTPS endpoints, so
+    concurrent summaries share one connection; plain-HTTP local servers
+    are unaffected.
+    """
+    http2 = importlib.util.find_spec("h2") is not None
+    return httpx.Client(http2=http2)
+
+
 def complete(prompt, base_url=None, model=None, api_key=None,
-             allow_remote=False):
+             allow_remote=False, cache=False, cache_ttl=None, client=None,
+             stream=False):
     """Send a prompt to an OpenAI-compatible chat completions endpoint.
 
     Raises RemoteEndpointError if the endpoint is non-local and
     allow_remote is False.
+
+    With cache=True, a previous completion for the same endpoint, model,
+    and prompt is returned from the on-disk cache (see mn.cache). cache_ttl
+    (seconds) ignores entries older than that.
+
+    Pass an httpx.Client as client to reuse its connection pool across
+    calls; otherwise each call opens a fresh connection.
+
+    With stream=True, returns an iterator over the text as the server
+    generates it (server-sent events) instead of the finished string.
+    Endpoint and cache checks still happen up front; HTTP errors surface
+    when iteration starts.
     """
-    base_url = base_url or os.environ.get("MN_API_BASE",
-                                           "http://localhost:11434/v1")
+    base_url = check_endpoint(base_url, allow_remote)
     model = model or os.environ.get("MN_MODEL", "llama3")
     api_key = api_key or os.environ.get("MN_API_KEY", "ollama")
+    remote = not _is_local(base_url)
+
+    key = None
+    if cache:
+        key = _cache.make_key(base_url, model, prompt)
+        cached = _cache.get("completions", key, max_age=cache_ttl)
+        if cached is not None:
+            _log.progress("  using cached summary")
+            return iter([cached]) if stream else cached
 
-    if not _is_local(base_url):
-        if not allow_remote:
-            raise RemoteEndpointError(
-                f"Refusing to send clinical data to remote endpoint "
-                f"({base_url}). Pass --allow-remote to confirm, or use "
-                f"a local LLM (e.g. ollama)."
-            )
+    if remote:
         _log.warn(
             f"Warning: sending transcript to remote endpoint ({base_url}). "
             f"Ensure you have appropriate data handling agreements in place."
@@ -119,29 +191,65 @@ def complete(prompt, base_url=None, model=None, api_key=None,
             f"or splitting the session."
         )
 
-    resp = httpx.post(
-        f"{base_url.rstrip('/')}/chat/completions",
-        json={
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.3,
-        },
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=300.0,
-    )
+    url = f"{base_url.rstrip('/')}/chat/completions"
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.3,
+    }
+    headers = {"Authorization": f"Bearer {api_key}"}
+    if stream:
+        return _stream(client, url, payload, headers, key)
+
+    post = client.post if client is not None else httpx.post
+    resp = post(url, json=payload, headers=headers, timeout=300.0)
     resp.raise_for_status()
     body = resp.json()
     try:
-        return body["choices"][0]["message"]["content"]
+        content = body["choices"][0]["message"]["content"]
     except (KeyError, IndexError, TypeError):
         raise RuntimeError(
             f"Unexpected LLM response format: {json.dumps(body)[:200]}"
         )
+    if key is not None:
+        _cache.put("completions", key, content)
+    return content
+
+
+def _stream(client, url, payload, headers, key):
+    """Yield content deltas from a streamed chat completion."""
+    request = client.stream if client is not None else httpx.stream
+    parts = []
+    with request("POST", url, json={**payload, "stream": True},
+                 headers=headers, timeout=300.0) as resp:
+        if resp.is_error:
+            resp.read()  # so the caller can report the error body
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            try:
+                delta = json.loads(data)["choices"][0]["delta"].get("content")
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+                raise RuntimeError(
+                    f"Unexpected LLM stream chunk: {data[:200]}"
+                )
+            if delta:
+                parts.append(delta)
+                yield delta
+    if key is not None:
+        _cache.put("completions", key, "".join(parts))
 
 
 def summarize(segments, template_path, client_name=None, session_date=None,
               **llm_kwargs):
-    """Segments + template file → summary text from LLM."""
+    """Segments + template file → summary text from LLM.
+
+    llm_kwargs go to complete(); with stream=True this returns an iterator.
+    """
     template_text = load_template(template_path)
     prompt = render(template_text, segments, client_name=client_name,
                     session_date=session_date)
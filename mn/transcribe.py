@@ -5,16 +5,39 @@ Pipeline: audio → words → speaker segments → aligned transcript.
 Each stage is a pure function. Compose them, or use transcribe_and_diarize
 for the full pipeline. Output is JSON lines — one segment per line:
 
-    {"speaker": "SPEAKER_00", "text": "...", "start": 0.0, "end": 2.5}
+    {"speaker":"SPEAKER_00","text":"...","start":0.0,"end":2.5}
+
+Lines are compact (no spaces after separators) and UTF-8: non-ASCII
+text is written as-is, not escaped. The CLI reads and writes them as
+UTF-8 bytes regardless of the locale encoding.
 """
 
 import json
 import os
-from dataclasses import asdict, dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson  # optional: pip install make-notes[fast]
+except ModuleNotFoundError:
+    orjson = None
+
+# orjson and the json fallback produce identical lines: compact, UTF-8.
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    _loads = json.loads
 
-@dataclass
+
+@dataclass(slots=True)
 class Segment:
     """A span of speech attributed to one speaker."""
     speaker: str
@@ -26,22 +49,60 @@ class Segment:
 # -- Stage 1: Transcribe ------------------------------------------------
 
 
-def load_whisper(model_size="base", device="cpu", compute_type="int8"):
-    """Load a WhisperModel. Reuse the returned object to avoid reloading."""
-    from faster_whisper import WhisperModel
-    return WhisperModel(model_size, device=device, compute_type=compute_type)
+def default_compute_type(device):
+    """Quantization for a device: int8 on CPU, int8 weights with float16
+    activations on CUDA (int8 GEMMs plus tensor-core float16)."""
+    return "int8_float16" if device.startswith("cuda") else "int8"
+
 
+def load_whisper(model_size="base", device="cpu", compute_type=None,
+                 num_workers=1):
+    """Load a WhisperModel. Reuse the returned object to avoid reloading.
 
-def transcribe(audio_path, model_size="base", device="cpu", compute_type="int8",
-               _model=None):
+    compute_type defaults per device, see default_compute_type().
+
+    num_workers is how many transcribe() calls the model can run at once
+    when it is shared between threads (e.g. mn-batch --jobs).
+
+    Models are stored under $MN_MODEL_CACHE when set (otherwise the
+    HuggingFace cache). A cached model is loaded without contacting the
+    Hub; the network is only used when it has not been downloaded yet.
+    """
+    from faster_whisper import WhisperModel
+    kwargs = dict(device=device,
+                  compute_type=compute_type or default_compute_type(device),
+                  num_workers=num_workers,
+                  download_root=os.environ.get("MN_MODEL_CACHE") or None)
+    try:
+        return WhisperModel(model_size, local_files_only=True, **kwargs)
+    except OSError:
+        # Not cached yet: huggingface_hub's LocalEntryNotFoundError is a
+        # FileNotFoundError. Anything else, e.g. the ValueError for a bad
+        # compute_type, propagates rather than retrying against the Hub.
+        return WhisperModel(model_size, **kwargs)
+
+
+def transcribe(audio_path, model_size="base", device="cpu", compute_type=None,
+               batch_size=None, _model=None):
     """Audio file → list of word dicts with timestamps.
 
+    With batch_size, the audio is split into voice-activity chunks that
+    are decoded batch_size at a time (faster-whisper's batched pipeline).
+    Mostly a GPU win; on CPU the default sequential decode is comparable.
+
     Pass _model (a WhisperModel) to skip loading — useful for batch mode.
     """
     if _model is None:
         _model = load_whisper(model_size, device, compute_type)
 
-    segments, _info = _model.transcribe(str(audio_path), word_timestamps=True)
+    if batch_size:
+        from faster_whisper import BatchedInferencePipeline
+        segments, _info = BatchedInferencePipeline(model=_model).transcribe(
+            str(audio_path), word_timestamps=True, batch_size=batch_size,
+        )
+    else:
+        segments, _info = _model.transcribe(str(audio_path),
+                                            word_timestamps=True)
 
     words = []
     for seg in segments:
@@ -66,11 +127,18 @@ def load_diarizer():
     )
 
 
+# pyannote doesn't document a Pipeline as safe to call from several
+# threads at once, and mn-batch --jobs shares one across its workers.
+# Whisper handles that itself (num_workers); diarization takes turns.
+_DIARIZE_LOCK = threading.Lock()
+
+
 def diarize(audio_path, num_speakers=None, min_speakers=None,
             max_speakers=None, _pipeline=None):
     """Audio file → list of speaker segment dicts.
 
     Pass _pipeline (a pyannote Pipeline) to skip loading — useful for batch.
+    Calls into the pipeline are serialized across threads.
     """
     if _pipeline is None:
         _pipeline = load_diarizer()
@@ -83,12 +151,12 @@ def diarize(audio_path, num_speakers=None, min_speakers=None,
     if max_speakers is not None:
         params["max_speakers"] = max_speakers
 
-    result = _pipeline(str(audio_path), **params)
-
-    return [
-        {"speaker": speaker, "start": turn.start, "end": turn.end}
-        for turn, _, speaker in result.itertracks(yield_label=True)
-    ]
+    with _DIARIZE_LOCK:
+        result = _pipeline(str(audio_path), **params)
+        return [
+            {"speaker": speaker, "start": turn.start, "end": turn.end}
+            for turn, _, speaker in result.itertracks(yield_label=True)
+        ]
 
 
 # -- Stage 3: Align -----------------------------------------------------
@@ -108,17 +176,39 @@ def align(words, speaker_segments):
         text = "".join(w["text"] for w in words).strip()
         return [Segment("Speaker", text, words[0]["start"], words[-1]["end"])]
 
+    # Sweep words and speaker segments together, both ordered by start.
+    # Segments that end before the current word starts can't overlap it
+    # or any later word, so the pointer i only moves forward: O(W + S)
+    # for the usual non-overlapping diarization instead of O(W·S).
+    # Ties go to the segment listed first, as before.
+    segs = sorted(enumerate(speaker_segments), key=lambda e: e[1]["start"])
+    i = 0
+    prev_start = None
+
     def _find_speaker(start, end):
+        nonlocal i, prev_start
+        if prev_start is not None and start < prev_start:
+            i = 0  # words out of order: restart the sweep
+        prev_start = start
+        while i < len(segs) and segs[i][1]["end"] < start:
+            i += 1
+
         mid = (start + end) / 2
-        best, best_overlap = "Unknown", 0.0
-        for seg in speaker_segments:
-            ov = max(0.0, min(end, seg["end"]) - max(start, seg["start"]))
-            if ov > best_overlap:
-                best, best_overlap = seg["speaker"], ov
-        if best_overlap == 0.0:
-            for seg in speaker_segments:
-                if seg["start"] <= mid <= seg["end"]:
-                    return seg["speaker"]
+        best, best_overlap, best_idx = "Unknown", 0.0, None
+        fallback, fallback_idx = None, None
+        for j in range(i, len(segs)):
+            idx, seg = segs[j]
+            if seg["start"] > end:
+                break
+            ov = min(end, seg["end"]) - max(start, seg["start"])
+            if ov > best_overlap or (ov == best_overlap > 0.0
+                                     and idx < best_idx):
+                best, best_overlap, best_idx = seg["speaker"], ov, idx
+            if (seg["start"] <= mid <= seg["end"]
+                    and (fallback_idx is None or idx < fallback_idx)):
+                fallback, fallback_idx = seg["speaker"], idx
+        if best_overlap == 0.0 and fallback is not None:
+            return fallback
         return best
 
     # Attribute each word, then merge runs of the same speaker.
@@ -127,42 +217,53 @@ def align(words, speaker_segments):
         for w in words
     ]
 
+    # Word texts are collected in a list and joined once per segment;
+    # += on a str would copy the whole run for every word.
     segments = []
     cur = None
     for w in attributed:
         if cur is None or w["speaker"] != cur["speaker"]:
             if cur:
-                cur["text"] = cur["text"].strip()
-                segments.append(Segment(**cur))
-            cur = dict(speaker=w["speaker"], text=w["text"],
+                segments.append(_flush(cur))
+            cur = dict(speaker=w["speaker"], text=[w["text"]],
                        start=w["start"], end=w["end"])
         else:
-            cur["text"] += w["text"]
+            cur["text"].append(w["text"])
             cur["end"] = w["end"]
 
     if cur:
-        cur["text"] = cur["text"].strip()
-        segments.append(Segment(**cur))
+        segments.append(_flush(cur))
 
     return segments
 
 
+def _flush(run):
+    """A merged run of words → Segment."""
+    return Segment(run["speaker"], "".join(run["text"]).strip(),
+                   run["start"], run["end"])
+
+
 # -- Composed pipeline ---------------------------------------------------
 
 
 def transcribe_and_diarize(audio_path, model_size="base", device="cpu",
-                           compute_type="int8", num_speakers=None,
+                           compute_type=None, num_speakers=None,
                            min_speakers=None, max_speakers=None,
-                           _whisper=None, _diarizer=None):
+                           batch_size=None, _whisper=None, _diarizer=None):
     """Full pipeline: audio file → list of diarized Segments.
 
+    Transcription and diarization are independent until alignment, so
+    they run concurrently on two threads.
+
     Pass _whisper and _diarizer to reuse pre-loaded models (batch mode).
     """
-    words = transcribe(audio_path, model_size, device, compute_type,
-                       _model=_whisper)
-    speakers = diarize(audio_path, num_speakers, min_speakers,
-                       max_speakers, _pipeline=_diarizer)
-    return align(words, speakers)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        words = pool.submit(transcribe, audio_path, model_size, device,
+                            compute_type, batch_size, _model=_whisper)
+        speakers = pool.submit(diarize, audio_path, num_speakers,
+                               min_speakers, max_speakers,
+                               _pipeline=_diarizer)
+        return align(words.result(), speakers.result())
 
 
 # -- Speaker labeling ----------------------------------------------------
@@ -198,13 +299,39 @@ def label_speakers(segments, names):
 
 def to_jsonl(segments):
     """Segments → JSON lines string."""
-    return "\n".join(json.dumps(asdict(s)) for s in segments)
+    return "\n".join(iter_jsonl_lines(segments))
+
+
+def iter_jsonl_lines(segments):
+    """Segments → JSON lines (without newlines), lazily."""
+    if orjson is not None:
+        # orjson encodes dataclasses natively, skipping asdict()'s
+        # recursive copy.
+        for s in segments:
+            yield orjson.dumps(s).decode()
+    else:
+        for s in segments:
+            yield _dumps({"speaker": s.speaker, "text": s.text,
+                          "start": s.start, "end": s.end})
 
 
 def from_jsonl(text):
     """JSON lines string → list of Segments."""
+    # Split on "\n" only: splitlines() would also break on U+2028 and
+    # other separators that may appear unescaped inside JSON strings.
     return [
-        Segment(**json.loads(line))
-        for line in text.strip().split("\n")
+        Segment(**_loads(line))
+        for line in text.split("\n")
         if line.strip()
     ]
+
+
+def iter_jsonl(lines):
+    """Iterable of JSON lines, str or bytes (e.g. a file) → Segments, lazily.
+
+    Parses one line at a time, so a consumer can start work before the
+    producer has finished writing.
+    """
+    for line in lines:
+        if line.strip():
+            yield Segment(**_loads(line))
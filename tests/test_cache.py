@@ -0,0 +1,113 @@
+"""Tests for mn.cache — on-disk transcript and completion cache."""
+
+import os
+import stat
+
+import pytest
+
+from mn import cache as _cache
+
+
+@pytest.fixture(autouse=True)
+def _cache_in_tmp(monkeypatch, tmp_path):
+    monkeypatch.setenv("MN_CACHE_DIR", str(tmp_path / "cache"))
+
+
+# -- cache_dir() ------------------------------------------------------------
+
+
+class TestCacheDir:
+
+    def test_honours_mn_cache_dir(self, tmp_path):
+        assert _cache.cache_dir() == tmp_path / "cache"
+
+    def test_defaults_under_xdg_cache_home(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("MN_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert _cache.cache_dir() == tmp_path / "xdg" / "make-notes"
+
+
+# -- Keys -------------------------------------------------------------------
+
+
+class TestKeys:
+
+    def test_hash_file_depends_on_contents(self, tmp_path):
+        a = tmp_path / "a.wav"
+        b = tmp_path / "b.wav"
+        a.write_bytes(b"one")
+        b.write_bytes(b"two")
+        assert _cache.hash_file(a) != _cache.hash_file(b)
+
+    def test_hash_file_ignores_name(self, tmp_path):
+        a = tmp_path / "a.wav"
+        b = tmp_path / "b.wav"
+        a.write_bytes(b"same")
+        b.write_bytes(b"same")
+        assert _cache.hash_file(a) == _cache.hash_file(b)
+
+    def test_make_key_is_stable(self):
+        assert _cache.make_key("m", 2, None) == _cache.make_key("m", 2, None)
+
+    def test_make_key_separates_parts(self):
+        assert _cache.make_key("ab", "c") != _cache.make_key("a", "bc")
+
+
+# -- get() / put() ----------------------------------------------------------
+
+
+class TestGetPut:
+
+    def test_miss_returns_none(self):
+        assert _cache.get("transcripts", "nope") is None
+
+    def test_roundtrip(self):
+        _cache.put("completions", "k1", "A note.")
+        assert _cache.get("completions", "k1") == "A note."
+
+    def test_kinds_are_separate(self):
+        _cache.put("completions", "k1", "note")
+        assert _cache.get("transcripts", "k1") is None
+
+    def test_entries_are_private(self, tmp_path):
+        _cache.put("transcripts", "k1", "{}")
+        root = tmp_path / "cache"
+        assert stat.S_IMODE(os.stat(root).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(root / "transcripts").st_mode) == 0o700
+        entry = root / "transcripts" / "k1"
+        assert stat.S_IMODE(os.stat(entry).st_mode) == 0o600
+
+    def test_max_age_keeps_fresh_entries(self):
+        _cache.put("completions", "k1", "note")
+        assert _cache.get("completions", "k1", max_age=3600) == "note"
+
+    def test_max_age_expires_and_deletes(self, tmp_path):
+        _cache.put("completions", "k1", "note")
+        entry = tmp_path / "cache" / "completions" / "k1"
+        os.utime(entry, (0, 0))
+        assert _cache.get("completions", "k1", max_age=3600) is None
+        assert not entry.exists()
+
+    def test_stored_as_utf8(self, tmp_path):
+        _cache.put("completions", "k1", "Zoë — café")
+        entry = tmp_path / "cache" / "completions" / "k1"
+        assert entry.read_bytes() == "Zoë — café".encode("utf-8")
+        assert _cache.get("completions", "k1") == "Zoë — café"
+
+    def test_unencodable_text_warns_and_leaves_no_temp_file(self, tmp_path,
+                                                            capsys):
+        _cache.put("completions", "k1", "lone surrogate \ud800")
+        assert "could not write cache" in capsys.readouterr().err
+        assert list((tmp_path / "cache" / "completions").iterdir()) == []
+
+    def test_undecodable_entry_is_a_miss(self, tmp_path):
+        _cache.put("completions", "k1", "note")
+        (tmp_path / "cache" / "completions" / "k1").write_bytes(b"\xff\xfe")
+        assert _cache.get("completions", "k1") is None
+
+    def test_unwritable_dir_warns(self, monkeypatch, tmp_path, capsys):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("MN_CACHE_DIR", str(blocker / "cache"))
+        _cache.put("transcripts", "k1", "{}")  # should not raise
+        assert "could not write cache" in capsys.readouterr().err
@@ -1,18 +1,26 @@
 """Tests for mn.cli — argument parsing and pipeline wiring."""
 
+import argparse
+import contextlib
+import functools
 import json
 import os
+import subprocess
 import sys
-from io import StringIO
+import threading
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import httpx
 import pytest
 
 from mn import cli
-from mn.cli import _check_audio_file, _check_hf_token, _check_template, _die
-from mn.transcribe import Segment, to_jsonl
+from mn.cli import (
+    _check_audio_file, _check_hf_token, _check_template, _die, _list_audio,
+)
+from mn.transcribe import Segment, from_jsonl, to_jsonl
 
 
 def _sample_segments():
@@ -22,15 +30,44 @@ def _sample_segments():
     ]
 
 
+@functools.lru_cache(maxsize=None)
 def _sample_jsonl():
+    # A str, so safe to share between tests; serialized once per run.
     return to_jsonl(_sample_segments())
 
 
+_PHONE_JSONL = to_jsonl([Segment("A", "Call 555-123-4567.", 0.0, 1.0)])
+
+
+@pytest.fixture(scope="session")
+def template(tmp_path_factory):
+    """A "$transcript" template, written once and shared read-only."""
+    path = tmp_path_factory.mktemp("templates") / "t.txt"
+    path.write_text("$transcript")
+    return path
+
+
+@pytest.fixture
+def skip_validation(monkeypatch):
+    """Skip file/token validation in the CLI tests that run the pipeline."""
+    monkeypatch.setenv("HF_TOKEN", "hf_test")
+    monkeypatch.setattr(cli, "_check_audio_file", lambda path: None)
+
+
+def _outputs(directory, pattern):
+    """Names in directory matching pattern, from one directory listing."""
+    return {p.name for p in directory.glob(pattern)}
+
+
+_LLM_REQUEST = httpx.Request("POST", "http://localhost:11434/v1/chat/completions")
+
+
 def _mock_llm_response(content="Generated note"):
+    # A fresh Response per call; only the request (URL parsing) is shared.
     return httpx.Response(
         200,
         json={"choices": [{"message": {"content": content}}]},
-        request=httpx.Request("POST", "http://localhost:11434/v1/chat/completions"),
+        request=_LLM_REQUEST,
     )
 
 
@@ -44,8 +81,11 @@ class TestFmtCli:
         monkeypatch.setattr("sys.argv", ["mn-fmt"])
         cli.fmt()
         out = capsys.readouterr().out
-        assert "SPEAKER_00: I feel anxious." in out
-        assert "SPEAKER_01: Tell me more." in out
+        assert out.splitlines() == [
+            "SPEAKER_00: I feel anxious.",
+            "",
+            "SPEAKER_01: Tell me more.",
+        ]
 
     def test_timestamps_flag(self, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
@@ -55,6 +95,12 @@ class TestFmtCli:
         assert "[00:00" in out
         assert "→" in out
 
+    def test_explicit_argv(self, capsys, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+        monkeypatch.setattr("sys.argv", ["mn-fmt", "--bogus"])
+        cli.fmt(["--timestamps"])
+        assert "[00:00" in capsys.readouterr().out
+
     def test_empty_stdin_produces_no_output(self, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO(""))
         monkeypatch.setattr("sys.argv", ["mn-fmt"])
@@ -62,6 +108,24 @@ class TestFmtCli:
         out = capsys.readouterr().out
         assert out == ""
 
+    def test_reads_utf8_regardless_of_stdin_encoding(self, capsys,
+                                                     monkeypatch):
+        data = to_jsonl([Segment("A", "Zoë said café.", 0.0, 1.0)]).encode()
+        stdin = TextIOWrapper(BytesIO(data), encoding="latin-1")
+        monkeypatch.setattr("sys.stdin", stdin)
+        cli.fmt([])
+        assert capsys.readouterr().out == "A: Zoë said café.\n"
+
+    def test_tty_stdin_fails_instead_of_blocking(self, capsys, monkeypatch):
+        tty = StringIO()
+        tty.isatty = lambda: True
+        monkeypatch.setattr("sys.stdin", tty)
+        monkeypatch.setattr("sys.argv", ["mn-fmt"])
+        with pytest.raises(SystemExit) as exc:
+            cli.fmt()
+        assert exc.value.code == 1
+        assert "No input on stdin" in capsys.readouterr().err
+
     def test_whitespace_only_stdin(self, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO("  \n\n  "))
         monkeypatch.setattr("sys.argv", ["mn-fmt"])
@@ -76,8 +140,7 @@ class TestFmtCli:
 class TestRedactCli:
 
     def test_basic_redaction(self, capsys, monkeypatch):
-        segs = [Segment("A", "Call 555-123-4567.", 0.0, 1.0)]
-        monkeypatch.setattr("sys.stdin", StringIO(to_jsonl(segs)))
+        monkeypatch.setattr("sys.stdin", StringIO(_PHONE_JSONL))
         monkeypatch.setattr("sys.argv", ["mn-redact"])
         cli.redact()
         out = capsys.readouterr().out
@@ -124,10 +187,7 @@ class TestSummarizeCli:
         out = capsys.readouterr().out
         assert "Generated note" in out
 
-    def test_empty_stdin_skips(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
+    def test_empty_stdin_skips(self, template, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO(""))
         monkeypatch.setattr("sys.argv", [
             "mn-summarize", "--template", str(template),
@@ -141,12 +201,8 @@ class TestSummarizeCli:
         with pytest.raises(SystemExit):
             cli.summarize()
 
-    def test_redact_flag(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
-        segs = [Segment("A", "Call 555-123-4567.", 0.0, 1.0)]
-        monkeypatch.setattr("sys.stdin", StringIO(to_jsonl(segs)))
+    def test_redact_flag(self, template, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO(_PHONE_JSONL))
         monkeypatch.setattr("sys.argv", [
             "mn-summarize", "--template", str(template),
             "--redact",
@@ -161,7 +217,7 @@ class TestSummarizeCli:
             assert "[PHONE]" in prompt
             assert "555-123-4567" not in prompt
 
-    def test_client_name_and_date(self, capsys, monkeypatch, tmp_path):
+    def test_client_name_and_date(self, monkeypatch, tmp_path):
         template = tmp_path / "t.txt"
         template.write_text("Client: $client_name Date: $date\n$transcript")
 
@@ -181,19 +237,102 @@ class TestSummarizeCli:
             assert "J.D." in prompt
             assert "2026-02-16" in prompt
 
+    def test_stream_writes_chunks(self, template, capsys, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+        monkeypatch.setattr("sys.argv", [
+            "mn-summarize", "--template", str(template), "--stream",
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+        ])
+        body = (
+            'data: {"choices": [{"delta": {"content": "Streamed "}}]}\n\n'
+            'data: {"choices": [{"delta": {"content": "note"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        resp = httpx.Response(
+            200, content=body.encode(),
+            request=httpx.Request("POST", "http://localhost:11434/v1"),
+        )
+        with patch("mn.summarize.httpx.stream",
+                   return_value=contextlib.nullcontext(resp)):
+            cli.summarize()
+        assert capsys.readouterr().out == "Streamed note\n"
+
+    def test_stream_connect_error(self, template, capsys, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+        monkeypatch.setattr("sys.argv", [
+            "mn-summarize", "--template", str(template), "--stream",
+            "--base-url", "http://localhost:11434/v1",
+        ])
+        with patch("mn.summarize.httpx.stream",
+                   side_effect=httpx.ConnectError("refused")):
+            with pytest.raises(SystemExit):
+                cli.summarize()
+        assert "Could not connect" in capsys.readouterr().err
+
+    def test_cache_reuses_summary(self, template, capsys, monkeypatch, tmp_path):
+        monkeypatch.setenv("MN_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr("sys.argv", [
+            "mn-summarize", "--template", str(template), "--cache",
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+        ])
+
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_llm_response("Cached note")) as mock:
+            for _ in range(2):
+                monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+                cli.summarize()
+            assert mock.call_count == 1
+
+        assert capsys.readouterr().out == "Cached note\nCached note\n"
+
+    def test_expired_cache_entry_is_refetched(self, template, monkeypatch,
+                                              tmp_path):
+        monkeypatch.setenv("MN_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr("sys.argv", [
+            "mn-summarize", "--template", str(template),
+            "--cache", "--cache-ttl", "1",
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+        ])
+
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_llm_response("Note")) as mock:
+            monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+            cli.summarize()
+            for entry in (tmp_path / "cache" / "completions").iterdir():
+                os.utime(entry, (0, 0))
+            monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+            cli.summarize()
+            assert mock.call_count == 2
+
+    def test_negative_cache_ttl_fails(self, template, capsys, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+        monkeypatch.setattr("sys.argv", [
+            "mn-summarize", "--template", str(template),
+            "--cache", "--cache-ttl", "-1",
+        ])
+        with pytest.raises(SystemExit):
+            cli.summarize()
+        assert "--cache-ttl" in capsys.readouterr().err
+
+    def test_cache_ttl_requires_cache(self, template, capsys, monkeypatch):
+        monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
+        monkeypatch.setattr("sys.argv", [
+            "mn-summarize", "--template", str(template), "--cache-ttl", "1",
+        ])
+        with pytest.raises(SystemExit):
+            cli.summarize()
+        assert "--cache-ttl requires --cache" in capsys.readouterr().err
+
 
 # -- mn-transcribe -----------------------------------------------------------
 
 
+@pytest.mark.usefixtures("skip_validation")
 class TestTranscribeCli:
 
-    @pytest.fixture(autouse=True)
-    def _skip_validation(self, monkeypatch):
-        """Skip file/token validation in transcribe CLI tests."""
-        monkeypatch.setenv("HF_TOKEN", "hf_test")
-        with patch("mn.cli._check_audio_file"):
-            yield
-
     def test_requires_audio_arg(self, monkeypatch):
         monkeypatch.setattr("sys.argv", ["mn-transcribe"])
         with pytest.raises(SystemExit):
@@ -206,17 +345,12 @@ class TestTranscribeCli:
         ])
 
         segments = _sample_segments()
-        with patch("mn.transcribe.transcribe_and_diarize",
-                    return_value=segments):
-            cli.transcribe()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: segments)
+        cli.transcribe()
 
         out = capsys.readouterr().out
-        lines = out.strip().split("\n")
-        assert len(lines) == 2
-        for line in lines:
-            obj = json.loads(line)
-            assert "speaker" in obj
-            assert "text" in obj
+        assert from_jsonl(out) == segments
 
     def test_speakers_flag_relabels(self, capsys, monkeypatch):
         monkeypatch.setattr("sys.argv", [
@@ -224,14 +358,13 @@ class TestTranscribeCli:
             "--speakers", "Therapist,Client",
         ])
 
-        with patch("mn.transcribe.transcribe_and_diarize",
-                    return_value=_sample_segments()):
-            cli.transcribe()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        cli.transcribe()
 
         out = capsys.readouterr().out
-        lines = [json.loads(l) for l in out.strip().split("\n")]
-        assert lines[0]["speaker"] == "Therapist"
-        assert lines[1]["speaker"] == "Client"
+        segs = from_jsonl(out)
+        assert [s.speaker for s in segs] == ["Therapist", "Client"]
 
     def test_passes_all_flags(self, monkeypatch):
         monkeypatch.setattr("sys.argv", [
@@ -239,6 +372,7 @@ class TestTranscribeCli:
             "--model", "large-v3",
             "--device", "cuda",
             "--compute-type", "float16",
+            "--batch-size", "8",
             "--num-speakers", "3",
             "--min-speakers", "2",
             "--max-speakers", "4",
@@ -256,6 +390,7 @@ class TestTranscribeCli:
                 num_speakers=3,
                 min_speakers=2,
                 max_speakers=4,
+                batch_size=8,
                 _whisper=None,
                 _diarizer=None,
             )
@@ -270,15 +405,11 @@ class TestTemplatesCli:
         monkeypatch.setattr("sys.argv", ["mn-templates"])
         cli.templates()
         out = capsys.readouterr().out
-        assert "soap" in out
-        assert "dap" in out
-        assert "birp" in out
-        assert "progress" in out
-        assert "cbt-soap" in out
-        assert "psychodynamic" in out
-        assert "intake" in out
-        assert "neuropsychoanalytic" in out
-        assert "informed-consent" in out
+        names = {line.split()[0] for line in out.splitlines()}
+        assert {
+            "soap", "dap", "birp", "progress", "cbt-soap", "psychodynamic",
+            "intake", "neuropsychoanalytic", "informed-consent",
+        } <= names
 
     def test_custom_dir(self, capsys, monkeypatch, tmp_path):
         (tmp_path / "custom.txt").write_text("Custom template for $transcript")
@@ -287,6 +418,30 @@ class TestTemplatesCli:
         out = capsys.readouterr().out
         assert "custom" in out
 
+    def test_description_is_first_nonempty_line(self, capsys, monkeypatch,
+                                                tmp_path):
+        (tmp_path / "a.txt").write_text("\n\n  Short note template  \nBody $transcript\n")
+        (tmp_path / "b.txt").write_text("B template\n")
+        monkeypatch.setattr("sys.argv", ["mn-templates", "--dir", str(tmp_path)])
+        cli.templates()
+        out = capsys.readouterr().out
+        assert out.splitlines() == [
+            f"  {'a':20s} Short note template",
+            f"  {'b':20s} B template",
+        ]
+
+    def test_skips_directories(self, capsys, monkeypatch, tmp_path):
+        (tmp_path / "a.txt").write_text("A template\n")
+        (tmp_path / "drafts.txt").mkdir()
+        monkeypatch.setattr("sys.argv", ["mn-templates", "--dir", str(tmp_path)])
+        cli.templates()
+        assert capsys.readouterr().out == f"  {'a':20s} A template\n"
+
+    def test_description_reads_only_header(self, tmp_path):
+        path = tmp_path / "late.txt"
+        path.write_text("\n" * cli._TEMPLATE_HEADER_BYTES + "Too far down\n")
+        assert cli._template_description(path) == ""
+
     def test_missing_dir_exits(self, monkeypatch):
         monkeypatch.setattr("sys.argv", ["mn-templates", "--dir", "/nonexistent"])
         with pytest.raises(SystemExit):
@@ -296,33 +451,35 @@ class TestTemplatesCli:
 # -- mn (main) ---------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("skip_validation")
 class TestMainCli:
 
-    @pytest.fixture(autouse=True)
-    def _skip_validation(self, monkeypatch):
-        """Skip file/token validation in main CLI tests."""
-        monkeypatch.setenv("HF_TOKEN", "hf_test")
-        with patch("mn.cli._check_audio_file"):
-            yield
-
     def test_requires_audio_and_template(self, monkeypatch):
         monkeypatch.setattr("sys.argv", ["mn"])
         with pytest.raises(SystemExit):
             cli.main()
 
-    def test_transcript_only_mode(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
+    def test_cache_ttl_requires_cache(self, template, capsys, monkeypatch):
+        monkeypatch.setattr("sys.argv", [
+            "mn", "test.wav", "--template", str(template),
+            "--transcript-only", "--cache-ttl", "7",
+        ])
+        with patch("mn.transcribe.transcribe_and_diarize") as tad:
+            with pytest.raises(SystemExit):
+                cli.main()
+        tad.assert_not_called()
+        assert "--cache-ttl requires --cache" in capsys.readouterr().err
 
+    def test_transcript_only_mode(self, template, capsys, monkeypatch):
         monkeypatch.setattr("sys.argv", [
             "mn", "test.wav",
             "--template", str(template),
             "--transcript-only",
         ])
 
-        with patch("mn.transcribe.transcribe_and_diarize",
-                    return_value=_sample_segments()):
-            cli.main()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        cli.main()
 
         out = capsys.readouterr().out
         assert "SPEAKER_00" in out
@@ -340,19 +497,16 @@ class TestMainCli:
             "--api-key", "test-key",
         ])
 
-        with patch("mn.transcribe.transcribe_and_diarize",
-                    return_value=_sample_segments()):
-            with patch("mn.summarize.httpx.post",
-                        return_value=_mock_llm_response("Final note")):
-                cli.main()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_llm_response("Final note")):
+            cli.main()
 
         out = capsys.readouterr().out
         assert "Final note" in out
 
-    def test_speakers_flag(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
+    def test_speakers_flag(self, template, capsys, monkeypatch):
         monkeypatch.setattr("sys.argv", [
             "mn", "test.wav",
             "--template", str(template),
@@ -360,18 +514,15 @@ class TestMainCli:
             "--speakers", "Therapist,Client",
         ])
 
-        with patch("mn.transcribe.transcribe_and_diarize",
-                    return_value=_sample_segments()):
-            cli.main()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        cli.main()
 
         out = capsys.readouterr().out
         assert "Therapist:" in out
         assert "Client:" in out
 
-    def test_redact_flag(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
+    def test_redact_flag(self, template, capsys, monkeypatch):
         segs = [Segment("A", "SSN is 123-45-6789.", 0.0, 1.0)]
         monkeypatch.setattr("sys.argv", [
             "mn", "test.wav",
@@ -380,17 +531,42 @@ class TestMainCli:
             "--redact",
         ])
 
-        with patch("mn.transcribe.transcribe_and_diarize", return_value=segs):
-            cli.main()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: segs)
+        cli.main()
 
         out = capsys.readouterr().out
         assert "[SSN]" in out
         assert "123-45-6789" not in out
 
-    def test_passes_whisper_and_diarization_flags(self, monkeypatch, tmp_path):
+    def test_cache_flag_reuses_transcript_and_summary(self, capsys,
+                                                      monkeypatch, tmp_path):
+        monkeypatch.setenv("MN_CACHE_DIR", str(tmp_path / "cache"))
+        audio = tmp_path / "session.wav"
+        audio.write_bytes(b"RIFF fake audio")
         template = tmp_path / "t.txt"
-        template.write_text("$transcript")
+        template.write_text("Summarize: $transcript")
 
+        monkeypatch.setattr("sys.argv", [
+            "mn", str(audio),
+            "--template", str(template),
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+            "--cache",
+        ])
+
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    return_value=_sample_segments()) as tad:
+            with patch("mn.summarize.httpx.post",
+                        return_value=_mock_llm_response("Final note")) as llm:
+                cli.main()
+                cli.main()
+
+        tad.assert_called_once()
+        llm.assert_called_once()
+        assert capsys.readouterr().out.count("Final note") == 2
+
+    def test_passes_whisper_and_diarization_flags(self, template, monkeypatch):
         monkeypatch.setattr("sys.argv", [
             "mn", "session.wav",
             "--template", str(template),
@@ -407,10 +583,11 @@ class TestMainCli:
                 "session.wav",
                 model_size="large-v3",
                 device="cuda",
-                compute_type="int8",
+                compute_type=None,
                 num_speakers=2,
                 min_speakers=None,
                 max_speakers=None,
+                batch_size=None,
                 _whisper=None,
                 _diarizer=None,
             )
@@ -419,20 +596,21 @@ class TestMainCli:
 # -- mn-batch ---------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("skip_validation")
 class TestBatchCli:
 
     @pytest.fixture(autouse=True)
-    def _skip_validation(self, monkeypatch):
-        """Skip file/token validation in batch CLI tests."""
-        monkeypatch.setenv("HF_TOKEN", "hf_test")
-        with patch("mn.cli._check_audio_file"):
-            yield
-
-    def test_processes_directory(self, capsys, monkeypatch, tmp_path):
+    def models(self, monkeypatch):
+        """Stand-in whisper and diarizer loaders ("w" and "d")."""
+        models = SimpleNamespace(whisper=MagicMock(return_value="w"),
+                                 diarizer=MagicMock(return_value="d"))
+        monkeypatch.setattr("mn.transcribe.load_whisper", models.whisper)
+        monkeypatch.setattr("mn.transcribe.load_diarizer", models.diarizer)
+        return models
+
+    def test_processes_directory(self, template, monkeypatch, tmp_path):
         # Create a fake audio file.
         (tmp_path / "session1.wav").write_bytes(b"fake audio")
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
 
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(tmp_path),
@@ -440,23 +618,20 @@ class TestBatchCli:
             "--transcript-only",
         ])
 
-        with patch("mn.transcribe.load_whisper", return_value="whisper_mock"):
-            with patch("mn.transcribe.load_diarizer", return_value="diarizer_mock"):
-                with patch("mn.transcribe.transcribe_and_diarize",
-                            return_value=_sample_segments()):
-                    cli.batch()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        cli.batch()
 
         out_file = tmp_path / "session1.txt"
         assert out_file.exists()
         content = out_file.read_text()
         assert "SPEAKER_00" in content
 
-    def test_models_loaded_once_for_batch(self, capsys, monkeypatch, tmp_path):
+    def test_models_loaded_once_for_batch(self, template, models, monkeypatch,
+                                          tmp_path):
         """Whisper and diarizer should be loaded once, not per file."""
         for name in ["a.wav", "b.wav", "c.wav"]:
             (tmp_path / name).write_bytes(b"fake")
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
 
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(tmp_path),
@@ -464,17 +639,13 @@ class TestBatchCli:
             "--transcript-only",
         ])
 
-        with patch("mn.transcribe.load_whisper",
-                    return_value="w") as whisper_load:
-            with patch("mn.transcribe.load_diarizer",
-                        return_value="d") as diarizer_load:
-                with patch("mn.transcribe.transcribe_and_diarize",
-                            return_value=_sample_segments()) as tad:
-                    cli.batch()
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    return_value=_sample_segments()) as tad:
+            cli.batch()
 
         # Models loaded exactly once, not 3 times.
-        whisper_load.assert_called_once()
-        diarizer_load.assert_called_once()
+        models.whisper.assert_called_once()
+        models.diarizer.assert_called_once()
         # But transcribe_and_diarize called 3 times (once per file).
         assert tad.call_count == 3
         # Each call should pass through the pre-loaded models.
@@ -482,15 +653,49 @@ class TestBatchCli:
             assert call[1]["_whisper"] == "w"
             assert call[1]["_diarizer"] == "d"
 
-    def test_output_dir(self, capsys, monkeypatch, tmp_path):
+    def test_models_load_concurrently(self, template, models, monkeypatch,
+                                      tmp_path):
+        # Each loader waits for the other; loading one after the other
+        # would break the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(*args, **kwargs):
+            barrier.wait()
+            return DEFAULT  # fall through to the fixture's return_value
+
+        models.whisper.side_effect = meet
+        models.diarizer.side_effect = meet
+        (tmp_path / "a.wav").write_bytes(b"fake")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--transcript-only",
+        ])
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    return_value=_sample_segments()) as tad:
+            cli.batch()
+        assert tad.call_args[1]["_whisper"] == "w"
+        assert tad.call_args[1]["_diarizer"] == "d"
+
+    def test_model_load_failure_exits(self, template, models, capsys,
+                                      monkeypatch, tmp_path):
+        models.diarizer.side_effect = OSError("no such model")
+        (tmp_path / "a.wav").write_bytes(b"fake")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--transcript-only",
+        ])
+        with pytest.raises(SystemExit):
+            cli.batch()
+        assert "Failed to load models: no such model" in capsys.readouterr().err
+
+    def test_output_dir(self, template, monkeypatch, tmp_path):
         audio_dir = tmp_path / "audio"
         audio_dir.mkdir()
         (audio_dir / "s.wav").write_bytes(b"fake")
         out_dir = tmp_path / "notes"
 
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(audio_dir),
             "--template", str(template),
@@ -498,32 +703,91 @@ class TestBatchCli:
             "--transcript-only",
         ])
 
-        with patch("mn.transcribe.load_whisper", return_value="w"):
-            with patch("mn.transcribe.load_diarizer", return_value="d"):
-                with patch("mn.transcribe.transcribe_and_diarize",
-                            return_value=_sample_segments()):
-                    cli.batch()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        cli.batch()
 
         assert (out_dir / "s.txt").exists()
 
-    def test_no_files_exits(self, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
+    def test_jobs_processes_all_files(self, template, models, monkeypatch,
+                                      tmp_path):
+        """With --jobs > 1, every file is still processed exactly once."""
+        for name in ["a.wav", "b.wav", "c.wav", "d.wav"]:
+            (tmp_path / name).write_bytes(b"fake")
 
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(tmp_path),
             "--template", str(template),
+            "--transcript-only",
+            "--jobs", "3",
+        ])
+
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    return_value=_sample_segments()) as tad:
+            cli.batch()
+
+        assert models.whisper.call_args[1]["num_workers"] == 3
+        assert tad.call_count == 4
+        audio_args = sorted(call[0][0] for call in tad.call_args_list)
+        assert audio_args == [str(tmp_path / f"{n}.wav") for n in "abcd"]
+        assert _outputs(tmp_path, "*.txt") == {f"{n}.txt" for n in "abcd"}
+
+    def test_jobs_must_be_positive(self, template, monkeypatch, tmp_path):
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--jobs", "0",
         ])
 
         with pytest.raises(SystemExit):
             cli.batch()
 
-    def test_mid_batch_failure_continues(self, capsys, monkeypatch, tmp_path):
+    def test_summary_overlaps_next_transcription(self, template, monkeypatch,
+                                                 tmp_path):
+        """The LLM call for one file runs while the next file transcribes."""
+        for name in ["a.wav", "b.wav"]:
+            (tmp_path / name).write_bytes(b"fake")
+
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+        ])
+
+        second_started = threading.Event()
+
+        def tracking_transcribe(audio, **kwargs):
+            if audio.endswith("b.wav"):
+                second_started.set()
+            return _sample_segments()
+
+        def slow_llm(*args, **kwargs):
+            # Only returns once b.wav transcription is under way.
+            assert second_started.wait(timeout=5)
+            return _mock_llm_response("Generated note")
+
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    side_effect=tracking_transcribe):
+            with patch("httpx.Client.post",
+                        side_effect=slow_llm):
+                cli.batch()
+
+        assert _outputs(tmp_path, "*.note.txt") == {"a.note.txt", "b.note.txt"}
+
+    def test_no_files_exits(self, template, monkeypatch, tmp_path):
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+        ])
+
+        with pytest.raises(SystemExit):
+            cli.batch()
+
+    def test_mid_batch_failure_continues(self, template, capsys, monkeypatch, tmp_path):
         """When one file fails transcription, remaining files still process."""
         for name in ["a.wav", "b.wav", "c.wav"]:
             (tmp_path / name).write_bytes(b"fake")
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
 
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(tmp_path),
@@ -541,27 +805,41 @@ class TestBatchCli:
                 raise RuntimeError("Transcription failed")
             return _sample_segments()
 
-        with patch("mn.transcribe.load_whisper", return_value="w"):
-            with patch("mn.transcribe.load_diarizer", return_value="d"):
-                with patch("mn.transcribe.transcribe_and_diarize",
-                            side_effect=flaky_transcribe):
-                    cli.batch()
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    side_effect=flaky_transcribe):
+            cli.batch()
 
         # a.txt and c.txt should exist; b.txt should not.
-        assert (tmp_path / "a.txt").exists()
-        assert not (tmp_path / "b.txt").exists()
-        assert (tmp_path / "c.txt").exists()
+        assert _outputs(tmp_path, "*.txt") == {"a.txt", "c.txt"}
 
         # Progress output should mention the failure.
         err = capsys.readouterr().err
         assert "1 file(s) failed" in err
         assert "b.wav" in err
 
-    def test_all_files_fail(self, capsys, monkeypatch, tmp_path):
+    def test_empty_file_skipped(self, template, capsys, monkeypatch, tmp_path):
+        """Empty files are reported as failed without being transcribed."""
+        (tmp_path / "a.wav").write_bytes(b"")
+        (tmp_path / "b.wav").write_bytes(b"fake")
+
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--transcript-only", "-vv",
+        ])
+
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    return_value=_sample_segments()) as mock_td:
+            cli.batch()
+
+        assert mock_td.call_count == 1
+        assert _outputs(tmp_path, "*.txt") == {"b.txt"}
+        err = capsys.readouterr().err
+        assert "1 file(s) failed: a.wav" in err
+
+    def test_all_files_fail(self, template, capsys, monkeypatch, tmp_path):
         """When all files fail, batch still completes with a summary."""
         (tmp_path / "x.wav").write_bytes(b"fake")
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
 
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(tmp_path),
@@ -569,23 +847,19 @@ class TestBatchCli:
             "--transcript-only", "-vv",
         ])
 
-        with patch("mn.transcribe.load_whisper", return_value="w"):
-            with patch("mn.transcribe.load_diarizer", return_value="d"):
-                with patch("mn.transcribe.transcribe_and_diarize",
-                            side_effect=RuntimeError("fail")):
-                    cli.batch()
+        with patch("mn.transcribe.transcribe_and_diarize",
+                    side_effect=RuntimeError("fail")):
+            cli.batch()
 
         assert not (tmp_path / "x.txt").exists()
         err = capsys.readouterr().err
         assert "1 file(s) failed" in err
         assert "0/1" in err
 
-    def test_summarize_failure_continues(self, capsys, monkeypatch, tmp_path):
+    def test_summarize_failure_continues(self, template, capsys, monkeypatch, tmp_path):
         """When LLM summarization fails for one file, others still process."""
         for name in ["a.wav", "b.wav", "c.wav"]:
             (tmp_path / name).write_bytes(b"fake")
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
 
         monkeypatch.setattr("sys.argv", [
             "mn-batch", str(tmp_path),
@@ -604,23 +878,163 @@ class TestBatchCli:
                 raise httpx.ConnectError("LLM is down")
             return _mock_llm_response("Generated note")
 
-        with patch("mn.transcribe.load_whisper", return_value="w"):
-            with patch("mn.transcribe.load_diarizer", return_value="d"):
-                with patch("mn.transcribe.transcribe_and_diarize",
-                            return_value=_sample_segments()):
-                    with patch("mn.summarize.httpx.post",
-                                side_effect=flaky_llm):
-                        cli.batch()
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        with patch("httpx.Client.post",
+                    side_effect=flaky_llm):
+            cli.batch()
 
         # a and c should have notes; b should not.
-        assert (tmp_path / "a.note.txt").exists()
-        assert not (tmp_path / "b.note.txt").exists()
-        assert (tmp_path / "c.note.txt").exists()
+        assert _outputs(tmp_path, "*.note.txt") == {"a.note.txt", "c.note.txt"}
 
         err = capsys.readouterr().err
         assert "1 file(s) failed" in err
         assert "b.wav" in err
 
+    def test_unexpected_summary_error_continues(self, template, capsys,
+                                                monkeypatch, tmp_path):
+        """Errors _call_summarize doesn't handle fail one file, not the batch."""
+        for name in ["a.wav", "b.wav", "c.wav"]:
+            (tmp_path / name).write_bytes(b"fake")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+            "-vv",
+        ])
+        responses = iter([_mock_llm_response("Note"),
+                          httpx.ReadTimeout("timed out"),
+                          _mock_llm_response("Note")])
+
+        def llm(*args, **kwargs):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        with patch("httpx.Client.post", side_effect=llm):
+            cli.batch()
+
+        assert _outputs(tmp_path, "*.note.txt") == {"a.note.txt", "c.note.txt"}
+        err = capsys.readouterr().err
+        assert "Error: b.wav: timed out" in err
+        assert "1 file(s) failed" in err
+
+    def test_interrupt_cancels_queued_files(self, template, monkeypatch,
+                                            tmp_path):
+        """Ctrl-C stops the batch instead of transcribing every queued file."""
+        for name in "abcde":
+            (tmp_path / f"{name}.wav").write_bytes(b"fake")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--transcript-only",
+        ])
+        started = []
+
+        def slow_transcribe(audio_path, **kwargs):
+            started.append(audio_path)
+            if len(started) > 1:
+                # Keep later files busy long enough for the cancel to land.
+                threading.Event().wait(0.5)
+            return _sample_segments()
+
+        real_wait = cli.wait
+        calls = 0
+
+        def interrupted_wait(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise KeyboardInterrupt
+            return real_wait(*args, **kwargs)
+
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            slow_transcribe)
+        monkeypatch.setattr(cli, "wait", interrupted_wait)
+        with pytest.raises(KeyboardInterrupt):
+            cli.batch()
+
+        # File a finished and b may have been running when Ctrl-C hit;
+        # c-e were still queued and never started.
+        assert [Path(p).name for p in started] in (["a.wav"],
+                                                   ["a.wav", "b.wav"])
+
+    def test_concurrent_summaries(self, template, monkeypatch, tmp_path):
+        """--max-concurrent-summaries lets LLM calls overlap each other."""
+        for name in ["a.wav", "b.wav"]:
+            (tmp_path / name).write_bytes(b"fake")
+
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+            "--max-concurrent-summaries", "2",
+        ])
+
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def llm(*args, **kwargs):
+            both_in_flight.wait()
+            return _mock_llm_response("Generated note")
+
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        with patch("httpx.Client.post", side_effect=llm):
+            cli.batch()
+
+        assert _outputs(tmp_path, "*.note.txt") == {"a.note.txt", "b.note.txt"}
+
+    def test_max_concurrent_summaries_must_be_positive(self, template, monkeypatch,
+                                                       tmp_path):
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path), "--template", str(template),
+            "--max-concurrent-summaries", "0",
+        ])
+        with pytest.raises(SystemExit):
+            cli.batch()
+
+    def test_negative_cache_ttl_fails_before_loading(self, template, capsys,
+                                                     monkeypatch, tmp_path):
+        (tmp_path / "a.wav").write_bytes(b"fake")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path), "--template", str(template),
+            "--cache", "--cache-ttl", "-1",
+        ])
+        with patch("mn.transcribe.load_whisper") as load:
+            with pytest.raises(SystemExit):
+                cli.batch()
+        load.assert_not_called()
+        assert capsys.readouterr().err.count("--cache-ttl") == 1
+
+    def test_summaries_share_one_http_client(self, template, monkeypatch,
+                                             tmp_path):
+        """One httpx.Client serves every summary in the batch."""
+        for name in ["a.wav", "b.wav", "c.wav"]:
+            (tmp_path / name).write_bytes(b"fake")
+
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path),
+            "--template", str(template),
+            "--base-url", "http://localhost:11434/v1",
+            "--llm-model", "m", "--api-key", "k",
+        ])
+
+        monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                            lambda *a, **kw: _sample_segments())
+        with patch("httpx.Client") as mock_client_cls:
+            client = mock_client_cls.return_value.__enter__.return_value
+            client.post.return_value = _mock_llm_response("Note")
+            cli.batch()
+
+        mock_client_cls.assert_called_once()
+        assert client.post.call_count == 3
+        assert (tmp_path / "c.note.txt").read_text() == "Note\n"
+
 
 # -- Error handling helpers -------------------------------------------------
 
@@ -656,6 +1070,13 @@ class TestCheckAudioFile:
         with pytest.raises(SystemExit):
             _check_audio_file(str(f))
 
+    def test_fails_for_inaccessible_path(self, capsys, tmp_path):
+        f = tmp_path / "file.wav"
+        f.write_bytes(b"data")
+        with pytest.raises(SystemExit):
+            _check_audio_file(str(f / "child.wav"))
+        assert "Cannot access" in capsys.readouterr().err
+
 
 class TestCheckHfToken:
 
@@ -684,6 +1105,108 @@ class TestCheckTemplate:
         _check_template(None)  # should not raise
 
 
+# -- _prefetch --------------------------------------------------------------
+
+
+class TestPrefetch:
+
+    def test_hints_file(self, tmp_path):
+        f = tmp_path / "a.wav"
+        f.write_bytes(b"data")
+        with patch("os.posix_fadvise", create=True) as fadvise:
+            cli._prefetch(f)
+        fadvise.assert_called_once()
+        assert fadvise.call_args[0][1:3] == (0, 0)
+
+    def test_missing_file_is_ignored(self, tmp_path):
+        cli._prefetch(tmp_path / "gone.wav")  # should not raise
+
+    def test_batch_prefetches_next_file(self, template, monkeypatch, tmp_path):
+        for name in ["a.wav", "b.wav", "c.wav"]:
+            (tmp_path / name).write_bytes(b"fake")
+        monkeypatch.setenv("HF_TOKEN", "hf_test")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path), "--template", str(template),
+            "--transcript-only",
+        ])
+
+        with patch("mn.transcribe.load_whisper", return_value="w"):
+            with patch("mn.transcribe.load_diarizer", return_value="d"):
+                monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                                    lambda *a, **kw: _sample_segments())
+                with patch("mn.cli._prefetch") as prefetch:
+                    cli.batch()
+
+        hinted = sorted(call[0][0].name for call in prefetch.call_args_list)
+        assert hinted == ["b.wav", "c.wav"]
+
+
+# -- Name lists ------------------------------------------------------------
+
+
+class TestSplitNames:
+
+    def test_splits_and_strips(self):
+        assert cli._split_names("Alice, Bob ,Carol") == ("Alice", "Bob", "Carol")
+
+    def test_empty_is_none(self):
+        assert cli._split_names(None) is None
+        assert cli._split_names("") is None
+
+    def test_repeated_value_reuses_tuple(self):
+        assert cli._split_names("A,B") is cli._split_names("A,B")
+
+
+# -- Shared parent parsers -------------------------------------------------
+
+
+class TestParentParsers:
+
+    def test_built_once(self):
+        assert cli._whisper_parent() is cli._whisper_parent()
+        assert cli._llm_parent() is cli._llm_parent()
+
+    def test_composed_flags_parse(self):
+        p = argparse.ArgumentParser(
+            parents=[cli._whisper_parent(), cli._diarization_parent(),
+                     cli._llm_parent()],
+        )
+        args = p.parse_args(["--model", "small", "--num-speakers", "2",
+                             "--llm-model", "m"])
+        assert args.model == "small"
+        assert args.num_speakers == 2
+        assert args.llm_model == "m"
+        assert args.device == "cpu"
+
+
+# -- _list_audio ------------------------------------------------------------
+
+
+class TestListAudio:
+
+    def test_filters_by_extension_and_sorts(self, tmp_path):
+        for name in ["b.wav", "a.wav", "notes.txt"]:
+            (tmp_path / name).write_bytes(b"data")
+        assert _list_audio(tmp_path, ".wav") == [
+            (tmp_path / "a.wav", 4),
+            (tmp_path / "b.wav", 4),
+        ]
+
+    def test_skips_directories(self, tmp_path):
+        (tmp_path / "dir.wav").mkdir()
+        (tmp_path / "x.wav").write_bytes(b"")
+        assert _list_audio(tmp_path, ".wav") == [(tmp_path / "x.wav", 0)]
+
+    def test_missing_directory_fails(self, template, capsys, monkeypatch, tmp_path):
+        monkeypatch.setenv("HF_TOKEN", "hf_test")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path / "nope"), "--template", str(template),
+        ])
+        with pytest.raises(SystemExit):
+            cli.batch()
+        assert "Cannot read directory" in capsys.readouterr().err
+
+
 # -- Progress and config integration ----------------------------------------
 
 
@@ -696,18 +1219,15 @@ class TestProgressReporting:
         monkeypatch.setenv("HF_TOKEN", "hf_test")
 
         with patch("mn.cli._check_audio_file"):
-            with patch("mn.transcribe.transcribe_and_diarize",
-                        return_value=_sample_segments()):
-                cli.transcribe()
+            monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                                lambda *a, **kw: _sample_segments())
+            cli.transcribe()
 
         err = capsys.readouterr().err
         assert "Transcribing" in err
         assert "2 segments" in err
 
-    def test_summarize_prints_progress(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
+    def test_summarize_prints_progress(self, template, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
         monkeypatch.setattr("sys.argv", [
             "mn-summarize", "--template", str(template),
@@ -731,9 +1251,9 @@ class TestProgressReporting:
         monkeypatch.setenv("MN_VERBOSE", "0")
 
         with patch("mn.cli._check_audio_file"):
-            with patch("mn.transcribe.transcribe_and_diarize",
-                        return_value=_sample_segments()):
-                cli.transcribe()
+            monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                                lambda *a, **kw: _sample_segments())
+            cli.transcribe()
 
         err = capsys.readouterr().err
         assert "Transcribing" not in err
@@ -748,7 +1268,7 @@ class TestConfigIntegration:
             "[transcribe]\n"
             'speakers = "Therapist,Client"\n'
         )
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("MN_CONFIG", str(cfg))
 
         # Create a fake audio file.
         audio = tmp_path / "test.wav"
@@ -760,15 +1280,14 @@ class TestConfigIntegration:
         monkeypatch.setenv("HF_TOKEN", "hf_test")
 
         with patch("mn.cli._check_audio_file"):
-            with patch("mn.transcribe.transcribe_and_diarize",
-                        return_value=_sample_segments()):
-                cli.transcribe()
+            monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                                lambda *a, **kw: _sample_segments())
+            cli.transcribe()
 
         out = capsys.readouterr().out
-        lines = [json.loads(l) for l in out.strip().split("\n")]
+        segs = from_jsonl(out)
         # Config set speakers=Therapist,Client, so labels should be applied.
-        assert lines[0]["speaker"] == "Therapist"
-        assert lines[1]["speaker"] == "Client"
+        assert [s.speaker for s in segs] == ["Therapist", "Client"]
 
 
 # -- Remote endpoint gate in CLI -------------------------------------------
@@ -776,10 +1295,7 @@ class TestConfigIntegration:
 
 class TestRemoteEndpointCli:
 
-    def test_summarize_blocks_remote_without_flag(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
+    def test_summarize_blocks_remote_without_flag(self, template, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
         monkeypatch.setattr("sys.argv", [
             "mn-summarize", "--template", str(template),
@@ -792,10 +1308,7 @@ class TestRemoteEndpointCli:
         err = capsys.readouterr().err
         assert "Refusing" in err or "remote" in err.lower()
 
-    def test_summarize_allows_remote_with_flag(self, capsys, monkeypatch, tmp_path):
-        template = tmp_path / "t.txt"
-        template.write_text("$transcript")
-
+    def test_summarize_allows_remote_with_flag(self, template, capsys, monkeypatch):
         monkeypatch.setattr("sys.stdin", StringIO(_sample_jsonl()))
         monkeypatch.setattr("sys.argv", [
             "mn-summarize", "--template", str(template),
@@ -811,6 +1324,35 @@ class TestRemoteEndpointCli:
         out = capsys.readouterr().out
         assert "Generated note" in out
 
+    def test_main_blocks_remote_before_transcribing(self, template, capsys, monkeypatch,
+                                                    tmp_path):
+        monkeypatch.setenv("HF_TOKEN", "hf_test")
+        monkeypatch.setattr("sys.argv", [
+            "mn", str(tmp_path / "session.wav"), "--template", str(template),
+            "--base-url", "https://api.openai.com/v1",
+        ])
+
+        with patch("mn.transcribe.transcribe_and_diarize") as mock_td:
+            with pytest.raises(SystemExit):
+                cli.main()
+        mock_td.assert_not_called()
+        assert "Refusing" in capsys.readouterr().err
+
+    def test_batch_blocks_remote_before_loading_models(self, template, capsys,
+                                                       monkeypatch, tmp_path):
+        (tmp_path / "a.wav").write_bytes(b"fake")
+        monkeypatch.setenv("HF_TOKEN", "hf_test")
+        monkeypatch.setattr("sys.argv", [
+            "mn-batch", str(tmp_path), "--template", str(template),
+            "--base-url", "https://api.openai.com/v1",
+        ])
+
+        with patch("mn.transcribe.load_whisper") as mock_load:
+            with pytest.raises(SystemExit):
+                cli.batch()
+        mock_load.assert_not_called()
+        assert "Refusing" in capsys.readouterr().err
+
 
 # -- Malformed config file -------------------------------------------------
 
@@ -820,7 +1362,7 @@ class TestMalformedConfig:
     def test_malformed_toml_warns_and_continues(self, capsys, monkeypatch, tmp_path):
         cfg = tmp_path / "mn.toml"
         cfg.write_text("this is not valid [[ toml")
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("MN_CONFIG", str(cfg))
         monkeypatch.setenv("HF_TOKEN", "hf_test")
 
         monkeypatch.setattr("sys.argv", [
@@ -828,9 +1370,55 @@ class TestMalformedConfig:
         ])
 
         with patch("mn.cli._check_audio_file"):
-            with patch("mn.transcribe.transcribe_and_diarize",
-                        return_value=_sample_segments()):
-                cli.transcribe()
+            monkeypatch.setattr("mn.transcribe.transcribe_and_diarize",
+                                lambda *a, **kw: _sample_segments())
+            cli.transcribe()
 
         err = capsys.readouterr().err
         assert "could not parse" in err.lower()
+
+
+# -- Locale encoding --------------------------------------------------------
+
+
+def _run_cli(command, stdin, encoding):
+    """Run an mn command in a subprocess with the given stdio encoding."""
+    env = dict(os.environ, PYTHONIOENCODING=encoding)
+    return subprocess.run(
+        [sys.executable, "-c", f"from mn import cli; cli.{command}([])"],
+        input=stdin, capture_output=True, env=env,
+    )
+
+
+class TestLocaleEncoding:
+
+    def test_jsonl_output_is_utf8_under_ascii_locale(self):
+        data = to_jsonl([Segment("A", "Zoë — call 555-123-4567.", 0.0, 1.0)])
+        result = _run_cli("redact", data.encode(), "ascii")
+        assert result.returncode == 0, result.stderr.decode()
+        assert from_jsonl(result.stdout.decode())[0].text == "Zoë — call [PHONE]."
+
+    def test_pipe_round_trips_under_latin1_locale(self):
+        data = to_jsonl([Segment("A", "Café at 555-123-4567.", 0.0, 1.0)])
+        redacted = _run_cli("redact", data.encode(), "latin-1")
+        assert redacted.returncode == 0, redacted.stderr.decode()
+        formatted = _run_cli("fmt", redacted.stdout, "latin-1")
+        assert formatted.returncode == 0, formatted.stderr.decode()
+        assert formatted.stdout.decode("latin-1") == "A: Café at [PHONE].\n"
+
+
+# -- Import cost ------------------------------------------------------------
+
+
+class TestLazyImports:
+
+    def test_importing_cli_skips_command_only_modules(self):
+        """`--help` and the stdin filters shouldn't pay for httpx & co."""
+        code = (
+            "import sys, mn.cli; "
+            "print(' '.join(m for m in ('httpx', 'mn.summarize', 'mn.record', "
+            "'mn.edit', 'mn.redact') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == ""
@@ -1,6 +1,7 @@
 """Tests for mn.config — TOML config file loading and application."""
 
 import argparse
+import os
 from pathlib import Path
 
 import pytest
@@ -51,6 +52,38 @@ class TestFindConfig:
         assert result is not None
         assert result.resolve() == local.resolve()
 
+    def test_mn_config_overrides_search(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "mn.toml").write_text("[transcribe]\nmodel = 'local'\n")
+        explicit = tmp_path / "other.toml"
+        explicit.write_text("[transcribe]\nmodel = 'explicit'\n")
+        monkeypatch.setenv("MN_CONFIG", str(explicit))
+        assert find_config() == explicit
+
+    def test_missing_mn_config_means_no_config(self, tmp_path, monkeypatch,
+                                               capsys):
+        from mn import log as _log
+        _log.configure(verbose=1)
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "mn.toml").write_text("[transcribe]\nmodel = 'local'\n")
+        monkeypatch.setenv("MN_CONFIG", str(tmp_path / "nope.toml"))
+        assert find_config() is None
+        err = capsys.readouterr().err
+        assert "MN_CONFIG file not found" in err
+        assert "nope.toml" in err
+
+    def test_skips_directory_named_like_config(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "mn.toml").mkdir()
+        xdg = tmp_path / "xdg"
+        xdg.mkdir()
+        cfg = xdg / "mn.toml"
+        cfg.write_text("[transcribe]\nmodel = 'xdg'\n")
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(xdg))
+        assert find_config().resolve() == cfg.resolve()
+        assert load_config()["transcribe"]["model"] == "xdg"
+
 
 # -- load_config() ----------------------------------------------------------
 
@@ -83,6 +116,47 @@ class TestLoadConfig:
         assert "could not parse" in err.lower()
 
 
+class TestLoadConfigCache:
+
+    def test_repeated_load_skips_parse(self, tmp_path, monkeypatch):
+        cfg = tmp_path / "mn.toml"
+        cfg.write_text("[transcribe]\nmodel = 'tiny'\n")
+        first = load_config(cfg)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config parsed twice")
+
+        monkeypatch.setattr("mn.config.tomllib.load", fail)
+        assert load_config(cfg) == first
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        cfg = tmp_path / "mn.toml"
+        cfg.write_text("[transcribe]\nmodel = 'tiny'\n")
+        assert load_config(cfg)["transcribe"]["model"] == "tiny"
+
+        cfg.write_text("[transcribe]\nmodel = 'large-v3'\n")
+        st = cfg.stat()
+        os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_config(cfg)["transcribe"]["model"] == "large-v3"
+
+    def test_size_change_is_reparsed_with_same_mtime(self, tmp_path):
+        cfg = tmp_path / "mn.toml"
+        cfg.write_text("[transcribe]\nmodel = 'tiny'\n")
+        st = cfg.stat()
+        assert load_config(cfg)["transcribe"]["model"] == "tiny"
+
+        cfg.write_text("[transcribe]\nmodel = 'medium'\n")
+        os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert load_config(cfg)["transcribe"]["model"] == "medium"
+
+    def test_parse_errors_are_not_cached(self, tmp_path, capsys):
+        cfg = tmp_path / "bad.toml"
+        cfg.write_text("not [[ valid")
+        load_config(cfg)
+        load_config(cfg)
+        assert capsys.readouterr().err.lower().count("could not parse") == 2
+
+
 # -- apply_config() --------------------------------------------------------
 
 
@@ -171,6 +245,31 @@ class TestApplyConfig:
         err = capsys.readouterr().err
         assert "should be int" in err
 
+    def test_non_bool_flag_ignored_with_warning(self, capsys):
+        from mn import log as _log
+        _log.configure(verbose=1)
+
+        args = self._make_args(allow_remote=False)
+        config = {"summarize": {"allow_remote": "yes"}}
+        apply_config(args, config)
+        assert args.allow_remote is False
+        assert "should be bool" in capsys.readouterr().err
+
+    def test_non_bool_redact_enabled_fails_closed(self, capsys):
+        from mn import log as _log
+        _log.configure(verbose=1)
+
+        for value in ("yes", 1):
+            args = self._make_args()
+            apply_config(args, {"redact": {"enabled": value}})
+            assert args.redact is True
+        assert "treating 'yes' as true" in capsys.readouterr().err
+
+    def test_falsy_redact_enabled_leaves_redaction_off(self):
+        args = self._make_args()
+        apply_config(args, {"redact": {"enabled": 0}})
+        assert args.redact is False
+
     def test_correct_type_accepted(self):
         args = self._make_args()
         config = {"transcribe": {"num_speakers": 3}}
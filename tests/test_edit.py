@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
-from mn.edit import _parse_time, edit, from_editable, to_editable
+from mn.edit import _tmp_root, edit, from_editable, to_editable
 from mn.transcribe import Segment
 
 
@@ -139,6 +139,30 @@ class TestFromEditable:
         assert len(result) == 1
         assert result[0].speaker == "A"
 
+    def test_header_does_not_span_lines(self):
+        text = (
+            "[00:00 → 00:05]\n"
+            "A:\n"
+            "Not a header.\n"
+            "\n"
+            "[00:05 → 00:10] B:\n"
+            "Valid block.\n"
+        )
+        result = from_editable(text)
+        assert [s.speaker for s in result] == ["B"]
+
+    def test_body_without_trailing_newline(self):
+        result = from_editable("[01:02 → 01:05] A:\nlast line")
+        assert result == [Segment("A", "last line", 62.0, 65.0)]
+
+    def test_minutes_past_an_hour(self):
+        result = from_editable("[61:01 → 62:00] A:\ntext")
+        assert (result[0].start, result[0].end) == (3661.0, 3720.0)
+
+    def test_malformed_timestamp_is_not_a_header(self):
+        text = "[1:2:3 → 0:05] A:\nskipped\n\n[a:b → 0:05] B:\nskipped\n"
+        assert from_editable(text) == []
+
 
 # -- Round-trip -------------------------------------------------------------
 
@@ -164,40 +188,6 @@ class TestRoundTrip:
         assert restored[0].text == "just me talking"
 
 
-# -- _parse_time() ----------------------------------------------------------
-
-
-class TestParseTime:
-
-    def test_zero(self):
-        assert _parse_time("0:00") == 0
-
-    def test_seconds(self):
-        assert _parse_time("0:45") == 45
-
-    def test_minutes_and_seconds(self):
-        assert _parse_time("2:05") == 125
-
-    def test_large_minutes(self):
-        assert _parse_time("61:01") == 3661
-
-    def test_invalid_single_part(self):
-        with pytest.raises(ValueError, match="Invalid timestamp"):
-            _parse_time("123")
-
-    def test_invalid_three_parts(self):
-        with pytest.raises(ValueError, match="Invalid timestamp"):
-            _parse_time("1:2:3")
-
-    def test_invalid_non_numeric(self):
-        with pytest.raises(ValueError, match="Invalid timestamp"):
-            _parse_time("a:b")
-
-    def test_invalid_empty(self):
-        with pytest.raises(ValueError, match="Invalid timestamp"):
-            _parse_time("")
-
-
 # -- edit() (subprocess / editor launcher) ----------------------------------
 
 
@@ -297,3 +287,43 @@ class TestEditFunction:
         assert len(created_paths) == 1
         assert not os.path.exists(created_paths[0])
         assert not os.path.exists(os.path.dirname(created_paths[0]))
+
+    def test_cleanup_when_segment_stream_fails(self, monkeypatch, tmp_path):
+        """A failing segment iterator must not leave a partial temp file."""
+        script = tmp_path / "noop-editor.sh"
+        script.write_text("#!/bin/sh\ntrue\n")
+        script.chmod(0o755)
+        monkeypatch.setenv("EDITOR", str(script))
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        def segments():
+            yield from self._segments()
+            raise ValueError("bad line")
+
+        with pytest.raises(ValueError):
+            edit(segments())
+        assert not list(tmp_path.glob("mn-edit-*"))
+
+    def test_temp_dir_under_xdg_runtime_dir(self, monkeypatch, tmp_path):
+        script = tmp_path / "noop-editor.sh"
+        script.write_text("#!/bin/sh\ntrue\n")
+        script.chmod(0o755)
+        runtime = tmp_path / "run"
+        runtime.mkdir()
+        monkeypatch.setenv("EDITOR", str(script))
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+
+        created_paths = []
+        original_run = subprocess.run
+
+        def spy_run(cmd, **kwargs):
+            created_paths.append(cmd[1])
+            return original_run(cmd, **kwargs)
+
+        with patch("mn.edit.subprocess.run", side_effect=spy_run):
+            edit(self._segments())
+        assert os.path.dirname(os.path.dirname(created_paths[0])) == str(runtime)
+
+    def test_missing_xdg_runtime_dir_falls_back(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "missing"))
+        assert _tmp_root() is None
@@ -1,6 +1,6 @@
 """Tests for mn.fmt — text formatting of transcript segments."""
 
-from mn.fmt import _ftime, fmt
+from mn.fmt import _ftime, fmt, iter_fmt
 from mn.transcribe import Segment
 
 
@@ -64,6 +64,23 @@ class TestFmt:
         assert result.count(":") == 3  # each speaker line has one colon
 
 
+# -- iter_fmt() -------------------------------------------------------------
+
+
+class TestIterFmt:
+
+    def test_one_line_per_segment(self):
+        assert list(iter_fmt(_two_segments())) == [
+            "SPEAKER_00: I've been feeling anxious.",
+            "SPEAKER_01: Can you tell me more?",
+        ]
+
+    def test_joined_matches_fmt(self):
+        segs = _two_segments()
+        assert "\n\n".join(iter_fmt(segs, timestamps=True)) == fmt(
+            segs, timestamps=True)
+
+
 # -- _ftime() ---------------------------------------------------------------
 
 
@@ -83,3 +100,9 @@ class TestFtime:
 
     def test_large_value(self):
         assert _ftime(3600) == "60:00"  # 1 hour = 60 minutes
+
+    def test_last_table_entry(self):
+        assert _ftime(3599.9) == "59:59"
+
+    def test_very_large_value(self):
+        assert _ftime(6000 * 60 + 7) == "6000:07"
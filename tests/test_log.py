@@ -1,5 +1,8 @@
 """Tests for mn.log — structured logging with verbosity control."""
 
+import time
+from io import StringIO
+
 from mn import log as _log
 
 
@@ -54,3 +57,85 @@ class TestLogging:
         _log.progress("test progress")
         err = capsys.readouterr().err
         assert "test progress" in err
+
+
+# -- buffered() -------------------------------------------------------------
+
+
+class _CountingStream(StringIO):
+    """StringIO that counts write() calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class TestBuffered:
+
+    def test_progress_written_once_on_exit(self, monkeypatch):
+        stream = _CountingStream()
+        monkeypatch.setattr("sys.stderr", stream)
+        _log.configure(verbose=2)
+        with _log.buffered(interval=60):
+            _log.progress("one")
+            _log.progress("two")
+            assert stream.getvalue() == ""
+        assert stream.getvalue() == "one\ntwo\n"
+        assert stream.writes == 1
+
+    def test_warning_flushes_pending_first(self, monkeypatch):
+        stream = _CountingStream()
+        monkeypatch.setattr("sys.stderr", stream)
+        _log.configure(verbose=2)
+        with _log.buffered(interval=60):
+            _log.progress("before")
+            _log.warn("careful")
+            assert stream.getvalue() == "before\ncareful\n"
+            _log.progress("after")
+        assert stream.getvalue() == "before\ncareful\nafter\n"
+
+    def test_flushes_periodically(self, monkeypatch):
+        stream = _CountingStream()
+        monkeypatch.setattr("sys.stderr", stream)
+        _log.configure(verbose=2)
+        with _log.buffered(interval=0.01):
+            _log.progress("tick")
+            for _ in range(500):
+                if stream.getvalue():
+                    break
+                time.sleep(0.01)
+            assert stream.getvalue() == "tick\n"
+
+    def test_unbuffered_after_exit(self, monkeypatch):
+        stream = _CountingStream()
+        monkeypatch.setattr("sys.stderr", stream)
+        _log.configure(verbose=2)
+        with _log.buffered(interval=60):
+            pass
+        _log.progress("direct")
+        assert stream.getvalue() == "direct\n"
+
+
+# -- Formatting -------------------------------------------------------------
+
+
+class TestFormatting:
+
+    def test_message_is_interpolated_without_prefix(self, capsys):
+        _log.configure(verbose=1)
+        _log._logger.warning("%d file(s) %s", 2, "failed")
+        assert capsys.readouterr().err == "2 file(s) failed\n"
+
+    def test_follows_replaced_stderr(self, monkeypatch):
+        _log.configure(verbose=1)
+        first, second = StringIO(), StringIO()
+        monkeypatch.setattr("sys.stderr", first)
+        _log.warn("one")
+        monkeypatch.setattr("sys.stderr", second)
+        _log.warn("two")
+        assert first.getvalue() == "one\n"
+        assert second.getvalue() == "two\n"
@@ -74,6 +74,36 @@ class TestRecord:
         assert sr == 16000
         assert len(data) > 0
 
+    def test_long_recording_written_in_order(self, tmp_path):
+        """Every block reaches the file, in capture order."""
+        import soundfile as sf
+
+        class LongInputStream:
+            def __init__(self, *, samplerate, channels, callback):
+                self._callback = callback
+                self._rate = samplerate
+
+            def __enter__(self):
+                for i in range(70):
+                    block = np.full((self._rate, 1), i / 100, dtype=np.float32)
+                    self._callback(block, self._rate, {}, None)
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+        mock_sd = MagicMock()
+        mock_sd.InputStream = LongInputStream
+        mock_sd.sleep = MagicMock(side_effect=lambda ms: None)
+
+        out = tmp_path / "test.wav"
+        with patch.dict("sys.modules", {"sounddevice": mock_sd}):
+            record(output_path=out, sample_rate=100, duration=0.1)
+
+        data, _sr = sf.read(str(out))
+        assert len(data) == 70 * 100
+        assert data[-1] == pytest.approx(0.69, abs=1e-3)
+
     def test_returns_none_when_no_frames(self, tmp_path):
         """If no audio frames are captured, record() returns None."""
 
@@ -96,21 +126,41 @@ class TestRecord:
             result = record(output_path=out, sample_rate=16000, duration=0.1)
 
         assert result is None
+        assert not out.exists()
 
     def test_duration_mode_uses_sleep(self, _mock_sd, tmp_path):
-        """With duration set, record() should call sd.sleep(duration * 1000)."""
+        """With duration set, record() sleeps duration * 1000 ms in short steps."""
+        calls = []
+        _mock_sd.sleep = calls.append
+        out = tmp_path / "test.wav"
+        record(output_path=out, sample_rate=16000, duration=2.5)
+        assert sum(calls) == 2500
+        assert max(calls) <= 100
+
+    def test_write_failure_warns_and_stops_capture(self, _mock_sd, tmp_path,
+                                                   capsys):
+        """A failed write is reported at once and ends capture early."""
+        import time
+
+        import soundfile as sf
+
         calls = []
-        original_sleep = _mock_sd.sleep
 
-        def tracking_sleep(ms):
+        def slow_sleep(ms):
             calls.append(ms)
-            return original_sleep(ms)
+            time.sleep(0.01)  # give the writer thread a chance to run
 
-        _mock_sd.sleep = tracking_sleep
+        _mock_sd.sleep = slow_sleep
         out = tmp_path / "test.wav"
-        record(output_path=out, sample_rate=16000, duration=2.5)
-        # First sleep call should be duration * 1000
-        assert calls[0] == 2500
+        with patch.object(sf.SoundFile, "write",
+                          side_effect=OSError("No space left on device")):
+            with pytest.raises(OSError, match="No space left"):
+                record(output_path=out, sample_rate=16000, duration=60)
+        # Stopped long before the 60 s requested, without a Ctrl-C.
+        assert sum(calls) < 60_000
+        err = capsys.readouterr().err
+        assert "could not write audio" in err
+        assert "No space left on device" in err
 
     def test_restores_sigint_handler(self, _mock_sd, tmp_path):
         original = signal.getsignal(signal.SIGINT)
@@ -1,6 +1,9 @@
 """Tests for mn.redact — PII redaction from transcript segments."""
 
-from mn.redact import redact, redact_text
+import re
+import time
+
+from mn.redact import _PATTERNS, _passes, _trie_regex, redact, redact_text
 from mn.transcribe import Segment
 
 
@@ -38,6 +41,34 @@ class TestRedactText:
         result = redact_text("Office at 456 Oak Ave")
         assert "[ADDRESS]" in result
 
+    def test_address_with_extra_spaces(self):
+        assert redact_text("at 12  Elm   Street") == "at [ADDRESS]"
+
+    def test_address_with_blank_street_name(self):
+        assert redact_text("555  Ave") == "[ADDRESS]"
+
+    def test_matches_original_address_pattern(self):
+        original = re.compile(
+            r"\b\d{1,5}\s+[\w\s]{1,30}"
+            r"(?:street|st|avenue|ave|boulevard|blvd|drive|dr|lane|ln"
+            r"|road|rd|court|ct|place|pl|way|circle|cir)\b",
+            re.IGNORECASE,
+        )
+        address = _PATTERNS[-1][0]
+        for text in ["555  Ave", "1 St", "12 \t Elm St", "7 Oak   Lane",
+                     "9  " + "x" * 29 + " rd", "9 " + "x" * 31 + " rd",
+                     "42" + " " * 40 + "way", "3 Main\nStreet"]:
+            found, expected = address.search(text), original.search(text)
+            assert (found and found.group()) == (expected and expected.group())
+
+    def test_long_whitespace_run_is_linear(self):
+        """A digit followed by a huge whitespace run used to backtrack
+        quadratically in the address pattern (~13 s for this input)."""
+        text = "1" + " " * 200_000 + "x"
+        start = time.perf_counter()
+        assert redact_text(text) == text
+        assert time.perf_counter() - start < 2.0
+
     def test_no_pii_unchanged(self):
         text = "I feel anxious about work."
         assert redact_text(text) == text
@@ -76,6 +107,56 @@ class TestRedactText:
         result = redact_text("John was here.", extra_names=["  John  "])
         assert "[NAME]" in result
 
+    def test_longer_name_wins_over_prefix(self):
+        result = redact_text("Ann Lee called.", extra_names=["Ann", "Ann Lee"])
+        assert result == "[NAME] called."
+
+    def test_name_does_not_rewrite_tags(self):
+        result = redact_text("Call 555-123-4567.", extra_names=["phone"])
+        assert result == "Call [PHONE]."
+
+    def test_email_not_split_by_phone_digits(self):
+        assert redact_text("j.5551234567@example.com") == "[EMAIL]"
+
+    # Overlapping matches: earlier patterns take priority, as when the
+    # patterns ran one after another.
+
+    def test_phone_beats_overlapping_date(self):
+        assert redact_text("1/2/555 123 4567") == "1/2/[PHONE]"
+
+    def test_email_beats_overlapping_name(self):
+        result = redact_text("Mary Jane@foo.com", extra_names=["Mary Jane"])
+        assert result == "Mary [EMAIL]"
+
+    def test_same_span_keeps_earlier_tag(self):
+        result = redact_text("Call 555-123-4567.", extra_names=["555-123-4567"])
+        assert result == "Call [PHONE]."
+
+
+class TestCompiledPatterns:
+
+    def test_patterns_compiled_at_import(self):
+        assert all(isinstance(p, re.Pattern) for p, _tag in _PATTERNS)
+
+    def test_name_pass_reused(self):
+        assert _passes(()) is _passes(())
+        assert _passes(("Ann",)) is _passes(("Ann",))
+
+
+class TestTrieRegex:
+
+    def test_shares_prefixes(self):
+        assert _trie_regex(("Anna", "Ann", "Bob")) == "(?:ann(?:a)?|bob)"
+
+    def test_matches_each_name_whole(self):
+        pattern = re.compile(rf"(?i:\b{_trie_regex(('Ann', 'Ann Lee', 'Al'))}\b)")
+        assert pattern.findall("Al, ann lee and Ann.") == ["Al", "ann lee", "Ann"]
+        assert pattern.findall("Anne and Alan") == []
+
+    def test_special_characters_escaped(self):
+        assert redact_text("Dr. O'Neil-Smith is here.",
+                           extra_names=["O'Neil-Smith"]) == "Dr. [NAME] is here."
+
 
 # -- redact() on Segments ---------------------------------------------------
 
@@ -114,5 +195,24 @@ class TestRedact:
         result = redact(segs, extra_names=["John"])
         assert "[NAME]" in result[0].text
 
+    def test_pattern_compiled_once_per_name_list(self):
+        _passes.cache_clear()
+        segs = [Segment("A", "John here.", 0.0, 1.0)] * 3
+        redact(segs, extra_names=["John"])
+        redact(segs, extra_names=["John"])
+        assert _passes.cache_info().misses == 1
+
+    def test_matches_do_not_span_segments(self):
+        segs = [
+            Segment("A", "I live at 123", 0.0, 1.0),
+            Segment("A", "Main Street.", 1.0, 2.0),
+        ]
+        assert [s.text for s in redact(segs)] == ["I live at 123", "Main Street."]
+
+    def test_text_containing_separator(self):
+        segs = [Segment("A", "a\x00b 555-123-4567", 0.0, 1.0),
+                Segment("B", "ok", 1.0, 2.0)]
+        assert [s.text for s in redact(segs)] == ["a\x00b [PHONE]", "ok"]
+
     def test_empty_segments(self):
         assert redact([]) == []
@@ -1,9 +1,10 @@
 """Tests for mn.summarize — template rendering and LLM integration."""
 
+import contextlib
 import json
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
@@ -11,11 +12,13 @@ import pytest
 from mn.summarize import (
     RemoteEndpointError,
     _TOKEN_WARNING_THRESHOLD,
-    _duration,
     _estimate_tokens,
     _is_local,
+    _span,
+    check_endpoint,
     complete,
     load_template,
+    make_client,
     render,
     summarize,
 )
@@ -48,12 +51,35 @@ class TestLoadTemplate:
         with pytest.raises(FileNotFoundError):
             load_template(tmp_path / "nope.txt")
 
+    def test_repeat_loads_read_once(self, tmp_path):
+        f = tmp_path / "t.txt"
+        f.write_text("Hello $transcript")
+        load_template(f)
+        with patch("mn.summarize.Path.read_text") as read:
+            assert load_template(f) == "Hello $transcript"
+        read.assert_not_called()
+
+    def test_edited_file_is_reread(self, tmp_path):
+        f = tmp_path / "t.txt"
+        f.write_text("Old $transcript")
+        load_template(f)
+        f.write_text("Newer $transcript")
+        assert load_template(f) == "Newer $transcript"
+
 
 # -- render() ---------------------------------------------------------------
 
 
 class TestRender:
 
+    def test_single_pass_over_iterator(self):
+        result = render("$speakers $duration\n$transcript", iter(_segments()))
+        assert result.startswith("SPEAKER_00, SPEAKER_01 0:02\n")
+        assert "Tell me more." in result
+
+    def test_empty_segments(self):
+        assert render("$duration|$speakers|$transcript", []) == "0:00||"
+
     def test_substitutes_transcript(self):
         result = render("BEGIN\n$transcript\nEND", _segments())
         assert "SPEAKER_00:" in result
@@ -126,28 +152,32 @@ class TestRender:
         assert "J.D." in result
 
 
-# -- _duration() ------------------------------------------------------------
+# -- Duration ---------------------------------------------------------------
 
 
 class TestDuration:
 
     def test_basic(self):
         segs = [Segment("A", "x", 0.0, 60.0)]
-        assert _duration(segs) == "1:00"
+        assert render("$duration", segs) == "1:00"
 
-    def test_multiple_segments(self):
+    def test_spans_earliest_start_to_latest_end(self):
         segs = [
-            Segment("A", "x", 10.0, 30.0),
             Segment("B", "y", 30.0, 135.0),
+            Segment("A", "x", 10.0, 30.0),
         ]
-        assert _duration(segs) == "2:05"
+        assert render("$duration", segs) == "2:05"
 
     def test_empty(self):
-        assert _duration([]) == "0:00"
+        assert render("$duration", []) == "0:00"
 
     def test_zero_duration(self):
         segs = [Segment("A", "x", 5.0, 5.0)]
-        assert _duration(segs) == "0:00"
+        assert render("$duration", segs) == "0:00"
+
+    def test_span_truncates_to_whole_seconds(self):
+        assert _span(0.0, 59.9) == "0:59"
+        assert _span(10.0, 3671.5) == "61:01"
 
 
 # -- complete() with mocked HTTP -------------------------------------------
@@ -225,6 +255,16 @@ class TestComplete:
             complete("prompt", base_url="http://localhost:11434/v1", model="m", api_key="k")
             assert mock.call_args[1]["timeout"] == 300.0
 
+    def test_uses_given_client(self):
+        client = MagicMock()
+        client.post.return_value = _mock_response("Pooled")
+        with patch("mn.summarize.httpx.post") as mock_post:
+            result = complete("prompt", base_url="http://localhost:11434/v1",
+                              model="m", api_key="k", client=client)
+        assert result == "Pooled"
+        client.post.assert_called_once()
+        mock_post.assert_not_called()
+
     def test_warns_on_long_prompt(self, capsys):
         # Generate a prompt that exceeds the token warning threshold.
         long_prompt = "x" * (_TOKEN_WARNING_THRESHOLD * 4 + 100)
@@ -243,6 +283,132 @@ class TestComplete:
         assert err == ""
 
 
+# -- complete() cache -------------------------------------------------------
+
+
+class TestCompleteCache:
+
+    @pytest.fixture(autouse=True)
+    def _cache_in_tmp(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MN_CACHE_DIR", str(tmp_path / "cache"))
+
+    def _complete(self, prompt="prompt", **kwargs):
+        kwargs.setdefault("cache", True)
+        return complete(prompt, base_url="http://localhost:11434/v1",
+                        model="m", api_key="k", **kwargs)
+
+    def test_second_call_hits_cache(self):
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_response("Cached")) as mock:
+            assert self._complete() == "Cached"
+            assert self._complete() == "Cached"
+        mock.assert_called_once()
+
+    def test_different_prompt_misses(self):
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_response("x")) as mock:
+            self._complete("one")
+            self._complete("two")
+        assert mock.call_count == 2
+
+    def test_disabled_by_default(self):
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_response("x")) as mock:
+            self._complete(cache=False)
+            self._complete(cache=False)
+        assert mock.call_count == 2
+
+    def test_remote_still_refused_on_hit(self):
+        with patch("mn.summarize.httpx.post",
+                    return_value=_mock_response("x")):
+            complete("p", base_url="https://api.example.com/v1", model="m",
+                     api_key="k", allow_remote=True, cache=True)
+        with pytest.raises(RemoteEndpointError):
+            complete("p", base_url="https://api.example.com/v1", model="m",
+                     api_key="k", cache=True)
+
+
+# -- complete(stream=True) --------------------------------------------------
+
+
+def _sse_response(*deltas, status=200):
+    """A streamed chat completion: one SSE data line per delta."""
+    lines = [
+        "data: " + json.dumps({"choices": [{"delta": {"content": d}}]})
+        for d in deltas
+    ]
+    body = "\n\n".join(lines + ["data: [DONE]"]) + "\n\n"
+    return httpx.Response(
+        status, content=body.encode(),
+        request=httpx.Request("POST", "http://test/v1/chat/completions"),
+    )
+
+
+@contextlib.contextmanager
+def _fake_stream(resp, calls=None):
+    def stream(method, url, **kwargs):
+        if calls is not None:
+            calls.append(kwargs)
+        return contextlib.nullcontext(resp)
+    with patch("mn.summarize.httpx.stream", side_effect=stream):
+        yield
+
+
+class TestCompleteStream:
+
+    def _complete(self, **kwargs):
+        return complete("prompt", base_url="http://localhost:11434/v1",
+                        model="m", api_key="k", stream=True, **kwargs)
+
+    def test_yields_deltas(self):
+        calls = []
+        with _fake_stream(_sse_response("Hel", "lo", "."), calls):
+            assert list(self._complete()) == ["Hel", "lo", "."]
+        assert calls[0]["json"]["stream"] is True
+
+    def test_http_error_raises_on_iteration(self):
+        with _fake_stream(_sse_response(status=500)):
+            chunks = self._complete()
+            with pytest.raises(httpx.HTTPStatusError):
+                list(chunks)
+
+    def test_bad_chunk_raises(self):
+        resp = httpx.Response(
+            200, content=b"data: {\"nope\": 1}\n\n",
+            request=httpx.Request("POST", "http://test/v1/chat/completions"),
+        )
+        with _fake_stream(resp):
+            with pytest.raises(RuntimeError, match="Unexpected LLM stream"):
+                list(self._complete())
+
+    def test_cached_after_full_stream(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MN_CACHE_DIR", str(tmp_path / "cache"))
+        with _fake_stream(_sse_response("A ", "note")):
+            assert "".join(self._complete(cache=True)) == "A note"
+        with patch("mn.summarize.httpx.stream") as mock:
+            assert list(self._complete(cache=True)) == ["A note"]
+        mock.assert_not_called()
+
+
+# -- make_client() ----------------------------------------------------------
+
+
+class TestMakeClient:
+
+    def test_http2_when_h2_installed(self):
+        with patch("mn.summarize.importlib.util.find_spec",
+                   return_value=object()):
+            with patch("mn.summarize.httpx.Client") as client_cls:
+                make_client()
+        client_cls.assert_called_once_with(http2=True)
+
+    def test_http1_without_h2(self):
+        with patch("mn.summarize.importlib.util.find_spec", return_value=None):
+            with patch("mn.summarize.httpx.Client") as client_cls:
+                make_client()
+        client_cls.assert_called_once_with(http2=False)
+
+
 # -- _estimate_tokens() ----------------------------------------------------
 
 
@@ -316,6 +482,22 @@ class TestRemoteEndpointGate:
         assert "remote endpoint" not in err
 
 
+class TestCheckEndpoint:
+
+    def test_returns_resolved_url(self, monkeypatch):
+        monkeypatch.setenv("MN_API_BASE", "http://127.0.0.1:8080/v1")
+        assert check_endpoint() == "http://127.0.0.1:8080/v1"
+
+    def test_blocks_remote_env_default(self, monkeypatch):
+        monkeypatch.setenv("MN_API_BASE", "https://api.openai.com/v1")
+        with pytest.raises(RemoteEndpointError):
+            check_endpoint()
+
+    def test_allows_remote_with_flag(self):
+        url = "https://api.openai.com/v1"
+        assert check_endpoint(url, allow_remote=True) == url
+
+
 # -- summarize() end-to-end with mock LLM ----------------------------------
 
 
@@ -417,6 +599,12 @@ class TestTemplateFiles:
         text = template_path.read_text()
         assert "$date" in text
 
+    def test_instructions_precede_session_fields(self, template_path):
+        # Identical leading text across sessions lets the LLM server reuse
+        # its cached prompt prefix; placeholders come after the "---".
+        text = template_path.read_text()
+        assert text.index("$") > text.rindex("\n---\n")
+
     def test_template_contains_draft_disclaimer(self, template_path):
         text = template_path.read_text()
         assert "draft" in text.lower() or "clinician review" in text.lower()
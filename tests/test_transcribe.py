@@ -1,8 +1,27 @@
 """Tests for mn.transcribe — alignment, serialization, labeling, and edge cases."""
 
 import json
-
-from mn.transcribe import Segment, align, from_jsonl, label_speakers, to_jsonl
+import random
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from mn import transcribe as _transcribe_mod
+from mn.transcribe import (
+    Segment,
+    align,
+    diarize,
+    from_jsonl,
+    iter_jsonl,
+    iter_jsonl_lines,
+    label_speakers,
+    load_whisper,
+    to_jsonl,
+    transcribe,
+    transcribe_and_diarize,
+)
 
 
 # -- Fixtures ---------------------------------------------------------------
@@ -152,6 +171,199 @@ class TestAlign:
         result = align(words, speakers)
         assert result[0].speaker == "B"
 
+    def test_matches_exhaustive_search(self):
+        """The sweep picks the same speaker as checking every segment."""
+        def brute(start, end, speakers):
+            mid = (start + end) / 2
+            best, best_ov = "Unknown", 0.0
+            for seg in speakers:
+                ov = max(0.0, min(end, seg["end"]) - max(start, seg["start"]))
+                if ov > best_ov:
+                    best, best_ov = seg["speaker"], ov
+            if best_ov == 0.0:
+                for seg in speakers:
+                    if seg["start"] <= mid <= seg["end"]:
+                        return seg["speaker"]
+            return best
+
+        rng = random.Random(0)
+        for _ in range(200):
+            speakers = []
+            for k in range(rng.randint(1, 8)):
+                start = rng.randint(0, 20) / 2
+                speakers.append({"speaker": f"S{k}", "start": start,
+                                 "end": start + rng.randint(0, 8) / 2})
+            rng.shuffle(speakers)
+            starts = sorted(rng.randint(0, 28) / 2 for _ in range(10))
+            words = [{"text": " w", "start": t, "end": t + rng.randint(0, 4) / 2}
+                     for t in starts]
+            expected = [brute(w["start"], w["end"], speakers) for w in words]
+            runs = [spk for i, spk in enumerate(expected)
+                    if i == 0 or spk != expected[i - 1]]
+            assert [seg.speaker for seg in align(words, speakers)] == runs
+
+    def test_out_of_order_words(self):
+        words = [
+            {"text": " late", "start": 5.0, "end": 5.5},
+            {"text": " early", "start": 0.2, "end": 0.5},
+        ]
+        speakers = [
+            {"speaker": "A", "start": 0.0, "end": 1.0},
+            {"speaker": "B", "start": 4.0, "end": 6.0},
+        ]
+        assert [s.speaker for s in align(words, speakers)] == ["B", "A"]
+
+
+# -- transcribe_and_diarize() -----------------------------------------------
+
+
+class _FakeWhisper:
+    """Stands in for WhisperModel; blocks until diarization has started."""
+
+    def __init__(self, started):
+        self._started = started
+
+    def transcribe(self, path, word_timestamps=False):
+        assert self._started.wait(timeout=5), "stages did not overlap"
+        words = [
+            SimpleNamespace(word=w["text"], start=w["start"], end=w["end"])
+            for w in _words_two_speakers()
+        ]
+        return [SimpleNamespace(words=words)], None
+
+
+class _FakeDiarization:
+
+    def itertracks(self, yield_label=False):
+        for s in _speakers_two():
+            turn = SimpleNamespace(start=s["start"], end=s["end"])
+            yield turn, None, s["speaker"]
+
+
+class _FakeDiarizer:
+    """Stands in for a pyannote Pipeline; signals that it has started."""
+
+    def __init__(self, started):
+        self._started = started
+
+    def __call__(self, path, **params):
+        self._started.set()
+        return _FakeDiarization()
+
+
+class TestTranscribeAndDiarize:
+
+    def test_aligns_both_stages(self):
+        started = threading.Event()
+        result = transcribe_and_diarize(
+            "session.wav",
+            _whisper=_FakeWhisper(started),
+            _diarizer=_FakeDiarizer(started),
+        )
+        assert [s.speaker for s in result] == ["SPEAKER_00", "SPEAKER_01"]
+        assert result[0].text == "I've been feeling anxious."
+
+
+class TestDiarizeShared:
+
+    def test_shared_pipeline_is_not_reentered(self):
+        """mn-batch --jobs shares one pipeline; calls must take turns."""
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def pipeline(path, **params):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.05)
+            with guard:
+                active -= 1
+            return _FakeDiarization()
+
+        threads = [
+            threading.Thread(target=diarize, args=(f"{i}.wav",),
+                             kwargs={"_pipeline": pipeline})
+            for i in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak == 1
+
+
+class TestTranscribeBatchSize:
+
+    def test_batch_size_uses_batched_pipeline(self, monkeypatch):
+        calls = []
+
+        class FakePipeline:
+            def __init__(self, model):
+                self.model = model
+
+            def transcribe(self, path, word_timestamps=False, batch_size=None):
+                calls.append((self.model, path, batch_size))
+                word = SimpleNamespace(word=" hi", start=0.0, end=0.5)
+                return [SimpleNamespace(words=[word])], None
+
+        monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(
+            BatchedInferencePipeline=FakePipeline))
+        words = transcribe("a.wav", batch_size=8, _model="model")
+        assert calls == [("model", "a.wav", 8)]
+        assert words == [{"text": " hi", "start": 0.0, "end": 0.5}]
+
+
+class TestLoadWhisper:
+
+    def _fake_model(self, monkeypatch, cached):
+        calls = []
+
+        def WhisperModel(size, local_files_only=False, **kwargs):
+            calls.append((local_files_only, kwargs["download_root"]))
+            if local_files_only and not cached:
+                raise FileNotFoundError("not in cache")
+            return "model"
+
+        monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(
+            WhisperModel=WhisperModel))
+        return calls
+
+    def test_cached_model_loads_offline(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MN_MODEL_CACHE", str(tmp_path))
+        calls = self._fake_model(monkeypatch, cached=True)
+        assert load_whisper("base") == "model"
+        assert calls == [(True, str(tmp_path))]
+
+    def test_downloads_when_not_cached(self, monkeypatch):
+        monkeypatch.delenv("MN_MODEL_CACHE", raising=False)
+        calls = self._fake_model(monkeypatch, cached=False)
+        assert load_whisper("base") == "model"
+        assert calls == [(True, None), (False, None)]
+
+    def test_invalid_settings_fail_without_download(self, monkeypatch):
+        calls = []
+
+        def WhisperModel(size, local_files_only=False, **kwargs):
+            calls.append(local_files_only)
+            raise ValueError("unsupported compute type")
+
+        monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(
+            WhisperModel=WhisperModel))
+        with pytest.raises(ValueError, match="compute type"):
+            load_whisper("base", compute_type="int3")
+        assert calls == [True]
+
+    def test_compute_type_defaults_per_device(self, monkeypatch):
+        seen = []
+        monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(
+            WhisperModel=lambda size, **kw: seen.append(kw["compute_type"])))
+        load_whisper("base", device="cpu")
+        load_whisper("base", device="cuda")
+        load_whisper("base", device="cuda", compute_type="bfloat16")
+        assert seen == ["int8", "int8_float16", "bfloat16"]
+
 
 # -- Serialization ----------------------------------------------------------
 
@@ -178,6 +390,10 @@ class TestSerialization:
             assert orig.start == rest.start
             assert orig.end == rest.end
 
+    def test_line_separator_inside_text(self):
+        segs = [Segment("A", "one\u2028two\x1cthree", 0.0, 1.0)]
+        assert from_jsonl(to_jsonl(segs)) == segs
+
     def test_from_jsonl_ignores_blank_lines(self):
         jsonl = (
             '{"speaker": "A", "text": "hello", "start": 0.0, "end": 1.0}\n'
@@ -192,6 +408,12 @@ class TestSerialization:
         original = [Segment("Solo", "just me", 0.0, 5.0)]
         assert from_jsonl(to_jsonl(original)) == original
 
+    def test_to_jsonl_is_compact_utf8(self):
+        seg = Segment("A", "café", 0.0, 1.0)
+        assert to_jsonl([seg]) == (
+            '{"speaker":"A","text":"café","start":0.0,"end":1.0}'
+        )
+
     def test_to_jsonl_empty(self):
         assert to_jsonl([]) == ""
 
@@ -202,6 +424,48 @@ class TestSerialization:
         assert restored.end == 2.654321
 
 
+class TestIterJsonl:
+
+    def test_parses_lines(self):
+        lines = to_jsonl(_sample_segments()).split("\n")
+        assert list(iter_jsonl(lines)) == _sample_segments()
+
+    def test_skips_blank_lines(self):
+        lines = ["\n", to_jsonl(_sample_segments()[:1]) + "\n", "  \n"]
+        assert len(list(iter_jsonl(lines))) == 1
+
+    def test_is_lazy(self):
+        """Segments are yielded before the input is exhausted."""
+        def lines():
+            yield to_jsonl(_sample_segments()[:1]) + "\n"
+            raise AssertionError("read past the first segment")
+
+        first = next(iter_jsonl(lines()))
+        assert first.speaker == "SPEAKER_00"
+
+
+class TestIterJsonlLines:
+
+    def test_matches_to_jsonl(self):
+        segs = _sample_segments()
+        assert "\n".join(iter_jsonl_lines(segs)) == to_jsonl(segs)
+
+    def test_empty(self):
+        assert list(iter_jsonl_lines([])) == []
+
+    def test_json_fallback_matches(self, monkeypatch):
+        """Lines are byte-identical with and without orjson."""
+        segs = [Segment("A", "café “quoted”", 0.0, 1.5)]
+        expected = [json.dumps({"speaker": "A", "text": "café “quoted”",
+                                "start": 0.0, "end": 1.5},
+                               ensure_ascii=False, separators=(",", ":"))]
+        assert list(iter_jsonl_lines(segs)) == expected
+        monkeypatch.setattr(_transcribe_mod, "orjson", None)
+        monkeypatch.setattr(_transcribe_mod, "_dumps", lambda obj: json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")))
+        assert list(iter_jsonl_lines(segs)) == expected
+
+
 # -- Segment dataclass ------------------------------------------------------
 
 